@@ -1,10 +1,12 @@
 import asyncio
+import contextvars
 import datetime
 import functools
 import hashlib
 import inspect
 import sys
 import types
+import weakref
 from typing import (
     Any,
     Awaitable,
@@ -59,10 +61,19 @@ CheckHandler = TypeVar(
 )
 CHECK_HANDLER_SIGNATURE = inspect.Signature(return_annotation=CheckHandlerResult)
 
+_ACCEPTABLE_HANDLER_TYPES = frozenset(get_args(CheckHandlerResult))
+_CHECK_HANDLER_SIGNATURE_REPR = repr(CHECK_HANDLER_SIGNATURE)
+
 Tag = pydantic.constr(
     strip_whitespace=True, min_length=1, max_length=32, regex="^([0-9a-z\\.-])*$"
 )
 
+@functools.lru_cache(maxsize=4096)
+def _check_id_for_name(name: str) -> str:
+    """Return a short identifier for a check derived from its name."""
+    return hashlib.blake2b(name.encode("utf-8"), digest_size=4).hexdigest()
+
+
 class CheckError(RuntimeError):
     def __init__(self, message: str, *, hint: Optional[str] = None, remedy: Optional[Callable[[], None]] = None) -> None:
         super().__init__(message)
@@ -132,7 +143,10 @@ class Check(pydantic.BaseModel, servo.logging.Mixin):
     can be presented to the user.
     """
 
-    created_at: datetime.datetime = None
+    # NOTE: Resolve `now` at call time rather than binding it at import so it can be frozen
+    created_at: datetime.datetime = pydantic.Field(
+        default_factory=lambda: datetime.datetime.now()
+    )
     """When the check was created (set automatically).
     """
 
@@ -151,8 +165,8 @@ class Check(pydantic.BaseModel, servo.logging.Mixin):
         *,
         handler: CheckHandler,
         description: Optional[str] = None,
-        args: List[Any] = [],
-        kwargs: Dict[Any, Any] = {},
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[Any, Any]] = None,
     ) -> "Check":
         """Run a check handler and return a Check object reporting the outcome.
 
@@ -179,7 +193,13 @@ class Check(pydantic.BaseModel, servo.logging.Mixin):
             A check object reporting the outcome of running the handler.
         """
         check = Check(name=name, description=description)
-        await run_check_handler(check, handler, *args, **kwargs)
+        await _run_check_handler(
+            check,
+            handler,
+            asyncio.iscoroutinefunction(handler),
+            tuple(args) if args else (),
+            kwargs or {},
+        )
         return check
 
     @property
@@ -208,20 +228,10 @@ class Check(pydantic.BaseModel, servo.logging.Mixin):
         """
         return self.severity == ErrorSeverity.warning
 
-    @pydantic.validator("created_at", pre=True, always=True)
-    @classmethod
-    def _set_created_at_now(cls, v):
-        return v or datetime.datetime.now()
-
     @pydantic.validator("id", pre=True, always=True)
     @classmethod
     def _generated_id(cls, v, values):
-        return (
-            v
-            or hashlib.blake2b(
-                values["name"].encode("utf-8"), digest_size=4
-            ).hexdigest()
-        )
+        return v or _check_id_for_name(values["name"])
 
     def __hash__(self):
         return hash((self.id,))
@@ -296,18 +306,21 @@ def check(
             severity=severity,
             tags=tags,
         )
+        # NOTE: The template is validated once here so runs can construct without validation
+        check_fields = __check__.dict()
+        check_fields_set = __check__.__fields_set__
 
         if asyncio.iscoroutinefunction(fn):
             @functools.wraps(fn)
             async def run_check(*args, **kwargs) -> Check:
-                check = __check__.copy()
-                await run_check_handler(check, fn, *args, **kwargs)
+                check = Check.construct(set(check_fields_set), **check_fields)
+                await _run_check_handler(check, fn, True, args, kwargs)
                 return check
 
         else:
             @functools.wraps(fn)
             def run_check(*args, **kwargs) -> Check:
-                check = __check__.copy()
+                check = Check.construct(set(check_fields_set), **check_fields)
                 run_check_handler_sync(check, fn, *args, **kwargs)
                 return check
 
@@ -361,6 +374,9 @@ MULTICHECK_SIGNATURE = inspect.Signature(
     return_annotation=Tuple[Iterable, CheckHandler]
 )
 
+# Check method functions that have passed signature validation mapped to whether they are coroutines
+_validated_check_functions: "weakref.WeakKeyDictionary[Callable[..., Check], bool]" = weakref.WeakKeyDictionary()
+
 
 class CheckFilter(pydantic.BaseModel):
     """CheckFilter objects are used to select a subset of available checks for execution.
@@ -386,6 +402,19 @@ class CheckFilter(pydantic.BaseModel):
 
     exclusive: bool = False
 
+    _match_fn: Optional[Callable[[Check], bool]] = pydantic.PrivateAttr(None)
+
+    def __setattr__(self, name, value) -> None: # noqa: D105
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            # constraints changed, rebuild the match function on next use
+            self._match_fn = None
+
+    def copy(self, **kwargs) -> "CheckFilter": # noqa: D102
+        filter_ = super().copy(**kwargs)
+        filter_._match_fn = None
+        return filter_
+
     @property
     def any(self) -> bool:
         """Return True if any constraints are in effect."""
@@ -405,43 +434,46 @@ class CheckFilter(pydantic.BaseModel):
         Returns:
             bool: True if the check meets the name, id, and tags constraints.
         """
-        if self.empty:
-            return True
+        if self._match_fn is None:
+            self._match_fn = self._build_match_fn()
+        return self._match_fn(check)
 
-        return (
-            self._matches_name(check)
-            and self._matches_id(check)
-            and self._matches_tags(check)
+    def _build_match_fn(self) -> Callable[[Check], bool]:
+        """Return a callable that evaluates all constraints of the filter against a check."""
+        if self.empty:
+            return lambda check: True
+
+        name_matcher = self._str_attr_matcher(self.name)
+        id_matcher = self._str_attr_matcher(self.id)
+        tags_matcher = self._tags_matcher(self.tags)
+        return lambda check: (
+            name_matcher(check.name)
+            and id_matcher(check.id)
+            and tags_matcher(check.tags)
         )
 
-    def _matches_name(self, check: Check) -> bool:
-        return self._matches_str_attr(self.name, check.name)
-
-    def _matches_id(self, check: Check) -> bool:
-        return self._matches_str_attr(self.id, check.id)
+    def _tags_matcher(self, tags: Optional[Set[str]]) -> Callable[[Optional[Set[str]]], bool]:
+        """Return a callable that matches the tags of a check against a tags constraint."""
+        if tags is None:
+            return lambda value: True
 
-    def _matches_tags(self, check: Check) -> bool:
-        if self.tags is None:
-            return True
+        # exclude untagged checks if filtering by tag, otherwise look for an intersection in our sets
+        return lambda value: value is not None and not tags.isdisjoint(value)
 
-        # exclude untagged checks if filtering by tag
-        if check.tags is None:
-            return False
-
-        # look for an intersection in our sets
-        return bool(self.tags.intersection(check.tags))
-
-    def _matches_str_attr(
-        self, attr: Union[None, str, Sequence[str], Pattern[str]], value: str
-    ) -> bool:
+    def _str_attr_matcher(
+        self, attr: Union[None, str, Sequence[str], Pattern[str]]
+    ) -> Callable[[str], bool]:
+        """Return a callable that matches string values against a name or id constraint."""
         if attr is None:
-            return True
+            return lambda value: True
         elif isinstance(attr, str):
-            return value == attr
+            return lambda value: value == attr
+        elif self.exclusive and isinstance(attr, (Sequence, Pattern)):
+            return lambda value: False
         elif isinstance(attr, Sequence):
-            return value in attr and not self.exclusive
+            return attr.__contains__
         elif isinstance(attr, Pattern):
-            return bool(attr.search(value)) and not self.exclusive
+            return lambda value: bool(attr.search(value))
         else:
             raise ValueError(
                 f'unexpected value of type "{attr.__class__.__name__}": {attr}'
@@ -467,14 +499,17 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
     body tests a single aspect of the configuration (rescuing exceptions as necessary)
     and returns a `Check` object that models the results of the check performed.
 
-    Checks are executed in method definition order within the subclass (top to bottom).
-    Check methods can be implemented synchronously or asynchronously. Methods that are
-    declared as coroutines via the `async def` syntax are run asynchronously.
+    Check results are always returned in method definition order within the subclass
+    (top to bottom). Check methods can be implemented synchronously or asynchronously.
+    Methods that are declared as coroutines via the `async def` syntax are run asynchronously.
 
     By default, check execution is halted upon encountering a failure. This behavior
     allows the user to assume that the runtime environment described by preceding
     checks has been established and implement a narrowly scoped check. Halting execution
-    can be overridden via the `halt_on` argument.
+    can be overridden via the `halt_on` argument. Checks are only executed sequentially
+    when a halting severity is given: with a `halt_on` of `None` all selected checks are
+    run concurrently and may interleave, so checks that have side effects or share state
+    must not rely on running one after another.
 
     Attributes:
         config: The configuration object for the connector being checked.
@@ -499,7 +534,8 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
         Args:
             config: The connector configuration to initialize the checks instance with.
             matching: An optional filter to limit the set of checks that are run.
-            halt_on: The severity of check failure that should halt the run.
+            halt_on: The severity of check failure that should halt the run. When `None`,
+                checks are run concurrently and only the order of the results is preserved.
             kwargs: Additional arguments to initialize the checks instance with.
 
         Returns:
@@ -517,7 +553,11 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
 
         Args:
             matching: An optional filter to limit the set of checks that are run.
-            halt_on: The severity of check failure that should halt the run.
+            halt_on: The severity of check failure that should halt the run. When `None`,
+                checks are run concurrently and only the order of the results is preserved:
+                side effects of checks may interleave. If any check raises, the remaining
+                checks are cancelled and the error is propagated. Pass a severity to run
+                the checks sequentially in definition order.
 
         Returns:
             A list of checks that were run.
@@ -526,45 +566,38 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
         # expand any multicheck methods into instance methods
         await self._expand_multichecks()
 
-        # identify methods that match the filter
-        filtered_methods = []
-        for method_name, method in self._check_methods():
-            if matching and matching.any:
-                if isinstance(method, Checkable):
-                    spec = method.__check__
-                else:
-                    self.logger.warning(
-                        f'filtering requested but encountered non-filterable check method "{method_name}"'
-                    )
-                    continue
-
-                if not matching.matches(spec):
-                    continue
+        # discovery walks and validates the instance methods so it is only done once per run
+        check_methods = list(self._check_methods())
 
-            filtered_methods.append(method)
+        if matching is None or matching.empty:
+            # without constraints every check is selected
+            selected_methods = check_methods
+        else:
+            selected_methods = self._select_check_methods(check_methods, matching)
+
+        # without a halting severity the checks are independent and can run concurrently
+        if not halt_on:
+            tasks = [
+                asyncio.create_task(self._run_check_method(method_name, method))
+                for method_name, method in selected_methods
+            ]
+            try:
+                return list(await asyncio.gather(*tasks))
+            except BaseException:
+                # don't leave sibling checks running unobserved in the background
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
-        # iterate a second time to run filtered and required checks
         checks = []
-        for method_name, method in self._check_methods():
-            if method in filtered_methods:
-                filtered_methods.remove(method)
-            else:
-                spec = getattr(method, "__check__", None)
-                if spec:
-                    # once all filtered methods are removed, only run non-decorated
-                    if not spec.critical or not filtered_methods:
-                        continue
-
-            check = await method() if asyncio.iscoroutinefunction(method) else method()
-            if not isinstance(check, Check):
-                raise TypeError(
-                    f"invalid check \"{method_name}\": expected return type \"Check\" but handler returned \"{check.__class__.__name__}\""
-                )
-
+        for method_name, method in selected_methods:
+            check = await self._run_check_method(method_name, method)
             checks.append(check)
 
             # halt the run if necessary
-            if check.failed and halt_on:
+            if check.failed:
                 if (
                     halt_on == ErrorSeverity.warning
                     or (halt_on == ErrorSeverity.common and not check.warning)
@@ -574,6 +607,43 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
 
         return checks
 
+    def _select_check_methods(
+        self,
+        check_methods: List[Tuple[str, CheckRunner]],
+        matching: CheckFilter,
+    ) -> List[Tuple[str, CheckRunner]]:
+        # identify methods that match the filter
+        filtered_methods = set()
+        for method_name, method in check_methods:
+            if isinstance(method, Checkable):
+                spec = method.__check__
+            else:
+                self.logger.warning(
+                    f'filtering requested but encountered non-filterable check method "{method_name}"'
+                )
+                continue
+
+            if not matching.matches(spec):
+                continue
+
+            filtered_methods.add(method_name)
+
+        # iterate a second time to select filtered and required checks
+        selected_methods = []
+        for method_name, method in check_methods:
+            if method_name in filtered_methods:
+                filtered_methods.remove(method_name)
+            else:
+                spec = getattr(method, "__check__", None)
+                if spec:
+                    # once all filtered methods are removed, only run non-decorated
+                    if not spec.critical or not filtered_methods:
+                        continue
+
+            selected_methods.append((method_name, method))
+
+        return selected_methods
+
     async def run_one(
         self,
         *,
@@ -639,6 +709,19 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
 
         return result
 
+    async def _run_check_method(self, method_name: str, method: CheckRunner) -> Check:
+        is_coroutine = _validated_check_functions.get(method.__func__)
+        if is_coroutine is None:
+            is_coroutine = asyncio.iscoroutinefunction(method)
+
+        check = await method() if is_coroutine else method()
+        if not isinstance(check, Check):
+            raise TypeError(
+                f"invalid check \"{method_name}\": expected return type \"Check\" but handler returned \"{check.__class__.__name__}\""
+            )
+
+        return check
+
     def _check_methods(self) -> Generator[Tuple[str, CheckRunner], None, None]:
         """Iterate over all check methods and yield the method name and callable method instance in method definition order.
 
@@ -664,6 +747,11 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
                 _validate_multicheck_handler(method)
                 continue
 
+            # signatures are static so each function only needs to be validated once
+            if method.__func__ in _validated_check_functions:
+                yield (name, method)
+                continue
+
             handler_signature = inspect.Signature.from_callable(method)
             handler_globalns = inspect.currentframe().f_back.f_globals
             handler_localns = inspect.currentframe().f_back.f_locals
@@ -686,6 +774,7 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
                 name=name,
                 callable_description="check"
             )
+            _validated_check_functions[method.__func__] = asyncio.iscoroutinefunction(method)
 
             yield (name, method)
 
@@ -715,6 +804,11 @@ class BaseChecks(pydantic.BaseModel, servo.logging.Mixin):
         extra = pydantic.Extra.allow
 
 
+@functools.lru_cache(maxsize=1024)
+def _signature_of(fn: Callable) -> inspect.Signature:
+    return inspect.Signature.from_callable(fn)
+
+
 def _validate_check_handler(fn: CheckHandler) -> None:
     """
     Validate that a function or method is usable as a check handler.
@@ -728,40 +822,43 @@ def _validate_check_handler(fn: CheckHandler) -> None:
     Raises:
         TypeError: Raised if the handler function is invalid.
     """
-    signature = inspect.Signature.from_callable(fn)
-    if len(signature.parameters) >= 1:
+    signature = _signature_of(fn)
+    if signature.parameters:
         for param in signature.parameters.values():
             if param.name == "self" and param.kind == param.POSITIONAL_OR_KEYWORD:
                 continue
 
             raise TypeError(
-                f'invalid check handler "{fn.__name__}": unexpected parameter "{param.name}" in signature {repr(signature)}, expected {repr(CHECK_HANDLER_SIGNATURE)}'
+                f'invalid check handler "{fn.__name__}": unexpected parameter "{param.name}" in signature {repr(signature)}, expected {_CHECK_HANDLER_SIGNATURE_REPR}'
             )
 
-    error = TypeError(
-        f'invalid check handler "{fn.__name__}": incompatible return type annotation in signature {repr(signature)}, expected to match {repr(CHECK_HANDLER_SIGNATURE)}'
-    )
-    acceptable_types = set(get_args(CheckHandlerResult))
+    def error() -> TypeError:
+        return TypeError(
+            f'invalid check handler "{fn.__name__}": incompatible return type annotation in signature {repr(signature)}, expected to match {_CHECK_HANDLER_SIGNATURE_REPR}'
+        )
+
+    if signature.return_annotation is inspect.Signature.empty:
+        raise error()
+
     origin = get_origin(signature.return_annotation)
-    args = get_args(signature.return_annotation)
     if origin is not None:
+        args = get_args(signature.return_annotation)
         if origin == Union:
-            handler_types = set(args)
-            if handler_types - acceptable_types:
-                raise error
+            if not _ACCEPTABLE_HANDLER_TYPES.issuperset(args):
+                raise error()
         elif origin is tuple:
             if args != (bool, str):
-                raise error
+                raise error()
         else:
-            raise error
+            raise error()
     else:
         cls = (
             signature.return_annotation
             if inspect.isclass(signature.return_annotation)
             else signature.return_annotation.__class__
         )
-        if not cls in acceptable_types:
-            raise error
+        if not cls in _ACCEPTABLE_HANDLER_TYPES:
+            raise error()
 
 
 async def run_check_handler(
@@ -784,12 +881,25 @@ async def run_check_handler(
     Raises:
         ValueError: Raised if an invalid value is returned by the handler.
     """
+    await _run_check_handler(
+        check, handler, asyncio.iscoroutinefunction(handler), args, kwargs
+    )
+
+
+async def _run_check_handler(
+    check: Check,
+    handler: CheckHandler,
+    is_coroutine: bool,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> None:
+    # NOTE: Callers classify the handler up front so the test isn't repeated per run
     try:
         if len(args):
             check.name = check.name.format(item=args[0], self=args[0])
 
         check.run_at = datetime.datetime.now()
-        if asyncio.iscoroutinefunction(handler):
+        if is_coroutine:
             result = await handler(*args, **kwargs)
         else:
             result = handler(*args, **kwargs)
@@ -830,40 +940,73 @@ def _set_check_result(
     """Sets the result of a check handler run on a check instance."""
     check.success = True
 
-    if isinstance(result, str):
-        check.message = result
-    elif isinstance(result, bool):
-        check.success = result
+    # dispatch on the exact type first as handlers return a small, closed set of types
+    setter = _CHECK_RESULT_SETTERS.get(type(result))
+    if setter:
+        setter(check, result)
+    elif isinstance(result, str):
+        _set_message_result(check, result)
     elif isinstance(result, tuple):
-        check.success, check.message = result
-    elif result is None:
-        pass
+        _set_tuple_result(check, result)
     elif isinstance(result, Exception):
-        check.success = False
-        check.exception = result
-
-        if isinstance(result, CheckError):
-            # when a CheckError, we can assume the output is crafted
-            check.message = str(result)
-            check.hint = result.hint
-            check.remedy = result.remedy
-        elif isinstance(result, AssertionError):
-            # assertions are self explanatory
-            check.message = str(result)
-        else:
-            # arbitrary exceptions we have no idea, so be more pedantic
-            check.message = f"caught exception ({result.__class__.__name__}): {str(result) or repr(result)}"
+        _set_exception_result(check, result)
     else:
         raise ValueError(
             f'check method returned unexpected value of type "{result.__class__.__name__}"'
         )
 
 
+def _set_message_result(check: Check, result: str) -> None:
+    check.message = result
+
+
+def _set_success_result(check: Check, result: bool) -> None:
+    check.success = result
+
+
+def _set_tuple_result(check: Check, result: Tuple[bool, str]) -> None:
+    check.success, check.message = result
+
+
+def _set_none_result(check: Check, result: None) -> None:
+    pass
+
+
+def _set_exception_result(check: Check, result: Exception) -> None:
+    check.success = False
+    check.exception = result
+
+    if isinstance(result, CheckError):
+        # when a CheckError, we can assume the output is crafted
+        check.message = str(result)
+        check.hint = result.hint
+        check.remedy = result.remedy
+    elif isinstance(result, AssertionError):
+        # assertions are self explanatory
+        check.message = str(result)
+    else:
+        # arbitrary exceptions we have no idea, so be more pedantic
+        check.message = f"caught exception ({result.__class__.__name__}): {str(result) or repr(result)}"
+
+
+_CHECK_RESULT_SETTERS: Dict[type, Callable[[Check, Any], None]] = {
+    str: _set_message_result,
+    bool: _set_success_result,
+    tuple: _set_tuple_result,
+    type(None): _set_none_result,
+}
+
+
+# Batch handler tasks of generated checks, scoped to a single run of the checks
+_check_batches_var = contextvars.ContextVar("servox.checks.check_batches", default=None)
+
+
 def create_checks_from_iterable(
     handler: CheckHandler,
     iterable: Iterable,
     *,
     base_class: Type[BaseChecks] = BaseChecks,
+    batch_size: Optional[int] = None,
 ) -> BaseChecks:
     """Return a class wrapping each item in an iterable collection into check instance methods.
 
@@ -885,30 +1028,76 @@ def create_checks_from_iterable(
         iterable: An iterable collection of checkable items to be wrapped into check methods.
         base_class: The base class for the new checks subclass. Enables mixed mode checks where
             some are written by hand and others a are generated.
+        batch_size: An optional number of items to check per handler invocation. When given, the
+            handler is called with a list of up to `batch_size` items and must return a list of
+            results in the same order. Each item is still reported as an individual check.
 
     Returns:
         A new subclass of `BaseChecks` with instance method check implememntatiomns for each
         item in the `iterable` argument collection.
-    """
-    cls = type("_IterableChecks", (base_class,), {})
 
-    def create_fn(name, item):
+    Raises:
+        ValueError: Raised if the batch size is less than one.
+    """
+    items = list(iterable)
+    namespace: Dict[str, Any] = {}
+    if batch_size is not None:
+        if batch_size < 1:
+            raise ValueError(f"invalid batch size {batch_size}: must be at least 1")
+
+        async def run_all(self, **kwargs) -> List[Check]:
+            # batch results are shared by the checks of a chunk for the duration of a run
+            token = _check_batches_var.set({})
+            try:
+                return await super(cls, self).run_all(**kwargs)
+            finally:
+                _check_batches_var.reset(token)
+
+        namespace = {"run_all": run_all}
+
+    cls = type("_IterableChecks", (base_class,), namespace)
+    is_coroutine = asyncio.iscoroutinefunction(handler)
+
+    async def run_batch(chunk: List[Any]) -> List[CheckHandlerResult]:
+        results = await handler(chunk) if is_coroutine else handler(chunk)
+        return list(results)
+
+    def create_fn(name, item, index):
         async def fn(self) -> Check:
             check = fn.__check__.copy()
-            await run_check_handler(check, handler, item)
+            if batch_size is None:
+                await _run_check_handler(check, handler, is_coroutine, (item,), {})
+                return check
+
+            # outside of a run (e.g. calling the check method directly) the batch is not shared
+            batches = _check_batches_var.get()
+            if batches is None:
+                batches = {}
+
+            chunk_index, offset = divmod(index, batch_size)
+            batch = batches.get((cls, chunk_index))
+            if batch is None:
+                chunk = items[chunk_index * batch_size:(chunk_index + 1) * batch_size]
+                batch = asyncio.create_task(run_batch(chunk))
+                batches[(cls, chunk_index)] = batch
+
+            async def batch_result(item) -> CheckHandlerResult:
+                return (await batch)[offset]
+
+            await _run_check_handler(check, batch_result, True, (item,), {})
             return check
 
         return fn
 
-    for item in iterable:
+    for index, item in enumerate(items):
         if isinstance(item, Checkable):
             check = item.__check__().copy()
-            fn = create_fn(check.name, item)
+            fn = create_fn(check.name, item, index)
             fn.__check__ = check
         else:
             name = item.name if hasattr(item, "name") else str(item)
             check = Check(name=f"Check {name}")
-            fn = create_fn(name, item)
+            fn = create_fn(name, item, index)
             fn.__check__ = check
 
         method_name = f"check_{check.id}"
@@ -991,32 +1180,44 @@ def multicheck(
     """
     def decorator(fn_: MultiCheckHandler) -> MultiCheckExpander:
         _validate_multicheck_handler(fn_)
+        fn_is_coroutine = asyncio.iscoroutinefunction(fn_)
 
         @functools.wraps(fn_)
         async def create_checks(*args, **kwargs) -> Tuple[Iterable, CheckHandler]:
             def create_fn(check, item):
                 async def _fn(self) -> Check:
                     result_check = check.copy()
-                    await run_check_handler(result_check, handler, item)
+                    await _run_check_handler(
+                        result_check, handler, is_coroutine, (item,), {}
+                    )
                     return result_check
 
                 return _fn
 
             checks_fns = {}
-            if asyncio.iscoroutinefunction(fn_):
+            if fn_is_coroutine:
                 iterable, handler = await fn_(*args, **kwargs)
             else:
                 iterable, handler = fn_(*args, **kwargs)
-
+            is_coroutine = asyncio.iscoroutinefunction(handler)
+
+            # validate the shared attributes once and stamp out lightweight copies per item
+            template = Check(
+                name=base_name,
+                description=description,
+                id=fn_.__name__,
+                severity=severity,
+                tags=tags,
+            )
             for index, item in enumerate(iterable):
                 check_name = base_name.format(item=item)
                 fn_name = f"{fn_.__name__}_item_{index}"
-                __check__ = Check(
-                    name=check_name,
-                    description=description,
-                    id=fn_name,
-                    severity=severity,
-                    tags=tags,
+                __check__ = template.copy(
+                    update={
+                        "name": check_name,
+                        "id": fn_name,
+                        "created_at": datetime.datetime.now(),
+                    }
                 )
                 fn = create_fn(__check__, item)
                 fn.__check__ = __check__
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import datetime
 import enum
 import functools
@@ -8,30 +9,21 @@ import json
 import os
 import pathlib
 import re
-import shlex
-import subprocess
 import sys
 import textwrap
-import time
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Literal, Optional, Pattern, Set, Tuple, Type, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Pattern, Set, Tuple, Type, Union
 
-import bullet
 import click
 import devtools
-import kubernetes_asyncio
 import loguru
+import orjson
 import pydantic
 import pygments
 import pygments.formatters
 import typer
 import yaml
 
-# Expose helpers
-from tabulate import tabulate
-from timeago import format as timeago
-
 import servo
-import servo.runner
 import servo.utilities.yaml
 
 
@@ -205,16 +197,32 @@ class Group(click.Group, ContextMixin):
     def make_context(self, info_name, args, parent=None, **extra):
         return ContextMixin.make_context(self, info_name, args, parent, **extra)
 
+    # Commands bucketed by section along with the longest command name, keyed by the command names
+    _sections_cache: Optional[Tuple[Tuple[str, ...], Dict[Section, Tuple[List[Tuple[str, Command]], int]]]] = None
+
     def format_commands(self, ctx, formatter):
         """
         Formats all commands into sections
         """
+        command_names = tuple(self.list_commands(ctx))
+        if self._sections_cache is None or self._sections_cache[0] != command_names:
+            self._sections_cache = (command_names, self._sections_of_commands(ctx, command_names))
+
+        for section, (commands, max_name_length) in self._sections_cache[1].items():
+            limit = formatter.width - 6 - max_name_length
+            rows = []
+            for name, command in commands:
+                help = command.get_short_help_str(limit)
+                rows.append((name, help))
 
-        sections_of_commands: Dict[Section, List[Tuple[str, Command]]] = {}
-        for section in Section:
-            sections_of_commands[section] = []
+            with formatter.section(section):
+                formatter.write_dl(rows)
 
-        for command_name in self.list_commands(ctx):
+    def _sections_of_commands(
+        self, ctx, command_names: Iterable[str]
+    ) -> Dict[Section, Tuple[List[Tuple[str, Command]], int]]:
+        sections_of_commands: Dict[Section, List[Tuple[str, Command]]] = collections.defaultdict(list)
+        for command_name in command_names:
             command = self.get_command(ctx, command_name)
             if command.hidden:
                 continue
@@ -222,22 +230,20 @@ class Group(click.Group, ContextMixin):
             # Determine the command section
             # NOTE: We may have non-CLI instances so we guard attribute access
             section = getattr(command, "section", Section.commands)
-
-            commands = sections_of_commands.get(section, [])
-            commands.append(
-                (
-                    command_name,
-                    command,
-                )
-            )
-            sections_of_commands[section] = commands
-
-        for section, commands in sections_of_commands.items():
-            if len(commands) == 0:
+            sections_of_commands[section].append((command_name, command))
+
+        # NOTE: Sections are emitted in declaration order followed by any ad-hoc sections
+        # (e.g. groups without a section) and empty sections are omitted
+        ordered_sections = [
+            *Section,
+            *(section for section in sections_of_commands if not isinstance(section, Section)),
+        ]
+        sections: Dict[Section, Tuple[List[Tuple[str, Command]], int]] = {}
+        for section in ordered_sections:
+            commands = sections_of_commands.get(section)
+            if not commands:
                 continue
 
-            limit = formatter.width - 6 - max(len(cmd[0]) for cmd in commands)
-
             # Sort the connector and other commands as ordering isn't explicit
             if section in (
                 Section.connectors,
@@ -245,13 +251,9 @@ class Group(click.Group, ContextMixin):
             ):
                 commands = sorted(commands)
 
-            rows = []
-            for name, command in commands:
-                help = command.get_short_help_str(limit)
-                rows.append((name, help))
+            sections[section] = (commands, max(len(cmd[0]) for cmd in commands))
 
-            with formatter.section(section):
-                formatter.write_dl(rows)
+        return sections
 
 
 class OrderedGroup(Group):
@@ -466,7 +468,7 @@ class CLI(typer.Typer, servo.logging.Mixin):
 
         # Conditionalize based on multi-servo options
         optimizer = None
-        configs = list(yaml.full_load_all(open(ctx.config_file)))
+        configs = list(yaml.full_load_all(ctx.config_file.read_text()))
         if not isinstance(configs, list):
             raise TypeError(
                 f'error: config file "{ctx.config_file}" parsed to an unexpected value of type "{configs.__class__}"'
@@ -549,19 +551,54 @@ class CLI(typer.Typer, servo.logging.Mixin):
 
     @staticmethod
     def connectors_named(names: List[str], servo_: servo.Servo) -> List[servo.BaseConnector]:
+        connectors_by_name: Dict[str, servo.BaseConnector] = {}
+        for connector in servo_.all_connectors:
+            connectors_by_name.setdefault(connector.name, connector)
+
         connectors: List[servo.BaseConnector] = []
         for name in names:
-            size = len(connectors)
-            for connector in servo_.all_connectors:
-                if connector.name == name:
-                    connectors.append(connector)
-                    break
-
-            if len(connectors) == size:
+            connector = connectors_by_name.get(name)
+            if connector is None:
                 raise typer.BadParameter(f"no connector found named '{name}'")
+            connectors.append(connector)
 
         return connectors
 
+    @staticmethod
+    def validate_connectors_respond_to_event(
+        connectors: Iterable[servo.BaseConnector], event: str
+    ) -> None:
+        for connector in connectors:
+            if not connector.responds_to_event(event):
+                raise typer.BadParameter(
+                    f"connectors of type '{connector.__class__.__name__}' do not respond to the event \"{event}\" (name='{connector.name}')"
+                )
+
+    @staticmethod
+    def metrics_callback(
+        context: typer.Context, value: Optional[List[str]]
+    ) -> Optional[List[servo.Metric]]:
+        """
+        Transforms one or more metric names into Metric objects
+        """
+        if not value:
+            return value
+
+        all_metrics_by_name: Dict[str, servo.Metric] = {}
+        results = run_async(context.servo.dispatch_event("metrics"))
+        for result in results:
+            for metric in result.value:
+                all_metrics_by_name[metric.name] = metric
+
+        metrics: List[servo.Metric] = []
+        for metric_name in value:
+            if metric := all_metrics_by_name.get(metric_name, None):
+                metrics.append(metric)
+            else:
+                raise typer.BadParameter(f"no metric found named '{metric_name}'")
+
+        return metrics
+
     @staticmethod
     def connectors_type_callback(
         context: typer.Context, value: Optional[Union[str, List[str]]]
@@ -786,6 +823,8 @@ class ServoCLI(CLI):
                 f"Generating servo.yaml. Do you want to select the connectors?"
             )
             if customize:
+                import bullet
+
                 types = servo.Assembly.all_connector_types()
                 types.remove(servo.Servo)
 
@@ -853,10 +892,8 @@ class ServoCLI(CLI):
                     c_list.append(c)
                     connectors_by_type[c_type] = c_list
 
-                for connector_type in connectors_by_type.keys():
-                    names = list(
-                        map(lambda c: c.name, connectors_by_type[connector_type])
-                    )
+                for connector_type, connectors_of_type in connectors_by_type.items():
+                    names = [c.name for c in connectors_of_type]
                     row = [
                         "\n".join(names),
                         connector_type.name,
@@ -888,12 +925,8 @@ class ServoCLI(CLI):
                 for result in results:
                     for component in result.value:
                         settings_list = sorted(
-                            list(
-                                map(
-                                    lambda s: f"{s.name}={s.human_readable_value} {s.summary()}",
-                                    component.settings,
-                                )
-                            )
+                            f"{s.name}={s.human_readable_value} {s.summary()}"
+                            for s in component.settings
                         )
                         row = [
                             component.name,
@@ -985,37 +1018,26 @@ class ServoCLI(CLI):
                         servo.Preposition.after,
                     ]
 
-                sorted_event_names = sorted(
-                    list(set(map(lambda handler: handler.event.name, event_handlers)))
-                )
+                # index the connectors handling each event and preposition in a single pass
+                connectors_by_event: Dict[Tuple[str, servo.Preposition], Set[str]] = collections.defaultdict(set)
+                for handler in event_handlers:
+                    connectors_by_event[(handler.event.name, handler.preposition)].add(
+                        handler.connector_type.name
+                    )
+
+                sorted_event_names = sorted(set(event_name for event_name, _ in connectors_by_event))
                 table = []
 
                 if by_connector:
                     headers = ["CONNECTOR", "EVENTS"]
-                    connector_types_by_name = dict(
-                        map(
-                            lambda handler: (
-                                handler.connector_type.name,
-                                connector,
-                            ),
-                            event_handlers,
-                        )
+                    sorted_connector_names = sorted(
+                        set(handler.connector_type.name for handler in event_handlers)
                     )
-                    sorted_connector_names = sorted(connector_types_by_name.keys())
                     for connector_name in sorted_connector_names:
-                        connector_types_by_name[connector_name]
                         event_labels = []
                         for event_name in sorted_event_names:
                             for preposition in prepositions:
-                                handlers = list(
-                                    filter(
-                                        lambda h: h.event.name == event_name
-                                        and h.preposition == preposition
-                                        and h.connector_type.name == connector_name,
-                                        event_handlers,
-                                    )
-                                )
-                                if handlers:
+                                if connector_name in connectors_by_event.get((event_name, preposition), ()):
                                     if preposition != servo.Preposition.on:
                                         event_labels.append(f"{preposition} {event_name}")
                                     else:
@@ -1027,29 +1049,13 @@ class ServoCLI(CLI):
                     headers = ["EVENT", "CONNECTORS"]
                     for event_name in sorted_event_names:
                         for preposition in prepositions:
-                            handlers = list(
-                                filter(
-                                    lambda h: h.event.name == event_name
-                                    and h.preposition == preposition,
-                                    event_handlers,
-                                )
-                            )
-                            if handlers:
-                                sorted_connector_names = sorted(
-                                    list(
-                                        set(
-                                            map(
-                                                lambda handler: handler.connector_type.name,
-                                                handlers,
-                                            )
-                                        )
-                                    )
-                                )
+                            connector_names = connectors_by_event.get((event_name, preposition))
+                            if connector_names:
                                 if preposition != servo.Preposition.on:
                                     label = f"{preposition} {event_name}"
                                 else:
                                     label = event_name
-                                row = [label, "\n".join(sorted(sorted_connector_names))]
+                                row = [label, "\n".join(sorted(connector_names))]
                                 table.append(row)
 
                 if len(context.assembly.servos) > 1:
@@ -1065,19 +1071,21 @@ class ServoCLI(CLI):
                 if context.servo and context.servo != servo_:
                     continue
 
-                metrics_to_connectors: Dict[str, Tuple[str, Set[str]]] = {}
+                # NOTE: The unit of the first connector reporting a metric wins
+                metrics_to_connectors: Dict[str, List[Union[servo.Unit, Set[str]]]] = collections.defaultdict(
+                    lambda: [None, set()]
+                )
                 results = run_async(servo_.dispatch_event("metrics"))
                 for result in results:
                     for metric in result.value:
-                        units_and_connectors = metrics_to_connectors.get(
-                            metric.name, [metric.unit, set()]
-                        )
+                        units_and_connectors = metrics_to_connectors[metric.name]
+                        if units_and_connectors[0] is None:
+                            units_and_connectors[0] = metric.unit
                         units_and_connectors[1].add(result.connector.__class__.name)
-                        metrics_to_connectors[metric.name] = units_and_connectors
 
                 headers = ["METRIC", "UNIT", "CONNECTORS"]
                 table = []
-                for metric in sorted(metrics_to_connectors.keys()):
+                for metric in sorted(metrics_to_connectors):
                     units_and_connectors = metrics_to_connectors[metric]
                     unit = units_and_connectors[0]
                     unit_str = f"{unit.name} ({unit.value})"
@@ -1096,16 +1104,10 @@ class ServoCLI(CLI):
         ) -> None:
             """List servos in the assembly"""
             headers = ["NAME", "OPTIMIZER", "DESCRIPTION"]
-            table = []
-
-            for servo_ in context.assembly.servos:
-                row = [
-                    servo_.name,
-                    servo_.optimizer.id,
-                    servo_.description or "-",
-                ]
-                table.append(row)
-
+            table = [
+                [servo_.name, servo_.optimizer.id, servo_.description or "-"]
+                for servo_ in context.assembly.servos
+            ]
             typer.echo(tabulate(table, headers, tablefmt="plain"))
 
         @self.command(section=Section.assembly)
@@ -1116,25 +1118,22 @@ class ServoCLI(CLI):
             ),
         ) -> None:
             """Display active connectors"""
-            table = []
             headers = ["NAME", "VERSION", "DESCRIPTION"]
             if verbose:
                 headers += ["HOMEPAGE", "MATURITY", "LICENSE"]
 
-            for connector_type in servo.Assembly.all_connector_types():
-                row = [
+            table = [
+                [
                     connector_type.__default_name__,
                     connector_type.version,
                     connector_type.description,
+                    *(
+                        (connector_type.homepage, connector_type.maturity, connector_type.license)
+                        if verbose else ()
+                    ),
                 ]
-                if verbose:
-                    row += [
-                        connector_type.homepage,
-                        connector_type.maturity,
-                        connector_type.license,
-                    ]
-                table.append(row)
-
+                for connector_type in servo.Assembly.all_connector_types()
+            ]
             typer.echo(tabulate(table, headers, tablefmt="plain") + "\n")
 
     def add_ops_commands(self, section=Section.ops) -> None:
@@ -1159,19 +1158,12 @@ class ServoCLI(CLI):
                 )
 
             if context.assembly:
-                servo.runner.AssemblyRunner(context.assembly).run()
+                from servo.runner import AssemblyRunner
+
+                AssemblyRunner(context.assembly).run()
             else:
                 raise typer.Abort("failed to assemble servo")
 
-        def validate_connectors_respond_to_event(
-            connectors: Iterable[servo.BaseConnector], event: str
-        ) -> None:
-            for connector in connectors:
-                if not connector.responds_to_event(event):
-                    raise typer.BadParameter(
-                        f"connectors of type '{connector.__class__.__name__}' do not respond to the event \"{event}\" (name='{connector.name}')"
-                    )
-
         @self.command(section=section)
         def check(
             context: Context,
@@ -1283,7 +1275,9 @@ class ServoCLI(CLI):
                     )
 
                 )
-                validate_connectors_respond_to_event(connector_objs, servo.Events.check)
+                self.validate_connectors_respond_to_event(connector_objs, servo.Events.check)
+
+                import kubernetes_asyncio
 
                 if os.getenv("KUBERNETES_SERVICE_HOST"):
                     kubernetes_asyncio.config.load_incluster_config()
@@ -1464,7 +1458,9 @@ class ServoCLI(CLI):
             # Return instead of exiting if we are being invoked
             if ready:
                 if run:
-                    servo.runner.AssemblyRunner(context.assembly).run()
+                    from servo.runner import AssemblyRunner
+
+                    AssemblyRunner(context.assembly).run()
                 elif not exit_on_success:
                     return
 
@@ -1507,9 +1503,9 @@ class ServoCLI(CLI):
                                 f"{component.name}.{setting.name}={setting.human_readable_value}"
                             )
 
-                    metrics_column = []
-                    for metric in description.metrics:
-                        metrics_column.append(f"{metric.name} ({metric.unit})")
+                    metrics_column = [
+                        f"{metric.name} ({metric.unit})" for metric in description.metrics
+                    ]
 
                     result.connector.name
                     row = [
@@ -1523,32 +1519,11 @@ class ServoCLI(CLI):
                     typer.echo(f"{servo_.name}")
                 typer.echo(tabulate(table, headers, tablefmt="plain"))
 
-        def metrics_callback(
-            context: typer.Context, value: Optional[List[str]]
-        ) -> Optional[List[servo.Metric]]:
-            if not value:
-                return value
-
-            all_metrics_by_name: Dict[str, servo.Metric] = {}
-            results = run_async(context.servo.dispatch_event("metrics"))
-            for result in results:
-                for metric in result.value:
-                    all_metrics_by_name[metric.name] = metric
-
-            metrics: List[servo.Metric] = []
-            for metric_name in value:
-                if metric := all_metrics_by_name.get(metric_name, None):
-                    metrics.append(metric)
-                else:
-                    raise typer.BadParameter(f"no metric found named '{metric_name}'")
-
-            return metrics
-
         @self.command(section=section)
         def measure(
             context: Context,
             metrics: Optional[List[str]] = typer.Argument(
-                None, help="Metrics to measure", callback=metrics_callback
+                None, help="Metrics to measure", callback=self.metrics_callback
             ),
             connectors: Optional[List[str]] = typer.Option(
                 None,
@@ -1673,20 +1648,16 @@ class ServoCLI(CLI):
 
                 headers = ["METRIC", "UNIT", "READINGS"]
                 table = []
-                for metric in sorted(aggregated_by_metric.keys(), key=lambda m: m.name):
+                for metric in sorted(aggregated_by_metric, key=lambda m: m.name):
                     readings_column = []
                     timestamp_to_connectors = aggregated_by_metric[metric]
-                    for timestamp in sorted(timestamp_to_connectors.keys()):
+                    for timestamp in sorted(timestamp_to_connectors):
                         for connector, values in timestamp_to_connectors[
                             timestamp
                         ].items():  # Dict[BaseConnector, Tuple[Numeric, Reading]]
                             readings_column.extend(
-                                list(
-                                    map(
-                                        lambda r: f"{r[0]:.2f} ({timeago(timestamp) if humanize else timestamp}) {attribute_connector(connector, r[1])}",
-                                        values,
-                                    )
-                                )
+                                f"{r[0]:.2f} ({timeago(timestamp) if humanize else timestamp}) {attribute_connector(connector, r[1])}"
+                                for r in values
                             )
 
                     row = [
@@ -1726,6 +1697,8 @@ class ServoCLI(CLI):
                 raise typer.BadParameter("service or port must be given")
 
             # TODO: Dry this up...
+            import kubernetes_asyncio
+
             if os.getenv("KUBERNETES_SERVICE_HOST"):
                 kubernetes_asyncio.config.load_incluster_config()
             else:
@@ -1771,6 +1744,8 @@ class ServoCLI(CLI):
                 raise typer.BadParameter("target must prefixed with Kubernetes object kind of \"deployment\" or \"pod\"")
 
             # TODO: Dry this up...
+            import kubernetes_asyncio
+
             if os.getenv("KUBERNETES_SERVICE_HOST"):
                 kubernetes_asyncio.config.load_incluster_config()
             else:
@@ -1888,7 +1863,8 @@ class ServoCLI(CLI):
             Display configured settings
             """
             include = set(keys) if keys else None
-            export_options = dict(exclude_unset=True, exclude_defaults=True, include=include, indent=2)
+            # NOTE: Only JSON output is indented, the other formats parse the JSON back into primitives
+            export_options = dict(exclude_unset=True, exclude_defaults=True, include=include)
 
             for servo_ in context.assembly.servos:
                 if context.servo_ and context.servo_ != servo_:
@@ -1897,11 +1873,10 @@ class ServoCLI(CLI):
                 if format == ConfigOutputFormat.text:
                     pass
                 else:
-                    lexer = format.lexer()
                     if format == ConfigOutputFormat.yaml:
                         data = servo_.config.yaml(sort_keys=True, **export_options)
                     elif format == ConfigOutputFormat.json:
-                        data = servo_.config.json(**export_options)
+                        data = servo_.config.json(indent=2, **export_options)
                     elif format == ConfigOutputFormat.dict:
                         # NOTE: Round-trip through JSON to produce primitives
                         config_dict = servo_.config.json(**export_options)
@@ -1958,7 +1933,7 @@ class ServoCLI(CLI):
                     else:
                         typer.echo(
                             pygments.highlight(
-                                data, lexer, pygments.formatters.TerminalFormatter()
+                                data, format.lexer(), _terminal_formatter()
                             )
                         )
 
@@ -2047,7 +2022,7 @@ class ServoCLI(CLI):
                     pygments.highlight(
                         output_data,
                         format.lexer(),
-                        pygments.formatters.TerminalFormatter(),
+                        _terminal_formatter(),
                     )
                 )
 
@@ -2078,7 +2053,7 @@ class ServoCLI(CLI):
         ) -> None:
             """Validate a configuration"""
             try:
-                configs = list(yaml.load_all(open(file), Loader=yaml.FullLoader))
+                configs = list(yaml.load_all(file.read_text(), Loader=yaml.FullLoader))
                 if not isinstance(configs, list):
                     raise ValueError(
                         f'error: config file "{file}" parsed to an unexpected value of type "{configs.__class__}"'
@@ -2097,7 +2072,7 @@ class ServoCLI(CLI):
                     config_model, routes = servo.assembly._create_config_model(
                         config=config, routes=routes
                     )
-                    config_model.parse_file(file)
+                    config_model.parse_obj(config)
             except (pydantic.ValidationError, yaml.scanner.ScannerError, KeyError) as e:
                 if not quiet:
                     typer.echo(f"X Invalid configuration in {file}", err=True)
@@ -2217,7 +2192,7 @@ class ServoCLI(CLI):
                     pygments.highlight(
                         config_yaml,
                         pygments.lexers.YamlLexer(),
-                        pygments.formatters.TerminalFormatter(),
+                        _terminal_formatter(),
                     )
                 )
                 typer.echo(f"Generated {file}")
@@ -2266,7 +2241,7 @@ class ServoCLI(CLI):
                         "version": str(connector_class.version),
                         "cryptonym": connector_class.cryptonym,
                     }
-                    typer.echo(json.dumps(version_info, indent=2))
+                    typer.echo(orjson.dumps(version_info, option=orjson.OPT_INDENT_2).decode())
                 else:
                     raise typer.BadParameter(f"Unknown format '{format}'")
             else:
@@ -2282,14 +2257,41 @@ class ServoCLI(CLI):
                         "homepage": connector_class.homepage,
                         "license": str(connector_class.license),
                     }
-                    typer.echo(json.dumps(version_info, indent=2))
+                    typer.echo(orjson.dumps(version_info, option=orjson.OPT_INDENT_2).decode())
                 else:
                     raise typer.BadParameter(f"Unknown format '{format}'")
 
             raise typer.Exit(0)
 
 
+def connectors_required(args: List[str]) -> bool:
+    """Return True if the commandline arguments may need discovered connectors.
+
+    Displaying the version of the servo itself is answered from static metadata
+    and can skip connector discovery. Everything else, including help output that
+    lists the connector commands, requires the connectors to be loaded.
+
+    Args:
+        args: The commandline arguments, excluding the program name.
+    """
+    if not args or args[0] != "version":
+        return True
+
+    remaining = iter(args[1:])
+    for arg in remaining:
+        if arg in ("-f", "--format"):
+            next(remaining, None)
+        elif arg in ("-h", "--help") or not arg.startswith("-"):
+            # help output and connector arguments depend on the loaded connectors
+            return True
+
+    return False
+
+
 def _run(args: Union[str, List[str]], **kwargs) -> None:
+    import shlex
+    import subprocess
+
     args = shlex.split(args) if isinstance(args, str) else args
     process = subprocess.run(args, **kwargs)
     if process.returncode != 0:
@@ -2312,9 +2314,27 @@ def run_async(future: Union[asyncio.Future, asyncio.Task, Awaitable]) -> Any:
     """
     return asyncio.get_event_loop().run_until_complete(future)
 
+# Expose helpers
+# NOTE: The tabulate and timeago modules are only needed to render output so they
+# are imported on first use to keep them off the startup path of every command.
+def tabulate(*args, **kwargs) -> str:
+    import tabulate as tabulate_
+
+    return tabulate_.tabulate(*args, **kwargs)
+
+def timeago(*args, **kwargs) -> str:
+    import timeago as timeago_
+
+    return timeago_.format(*args, **kwargs)
+
 def print_table(table, headers) -> None:
     typer.echo(tabulate(table, headers, tablefmt="plain") + "\n")
 
+@functools.lru_cache(maxsize=None)
+def _terminal_formatter() -> pygments.formatters.TerminalFormatter:
+    # NOTE: The formatter holds no per-highlight state so a single instance is shared
+    return pygments.formatters.TerminalFormatter()
+
 def _check_status_to_str(check: servo.Check) -> str:
     if check.success:
         return "√ PASSED"
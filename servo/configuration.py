@@ -3,7 +3,6 @@ from __future__ import annotations
 import abc
 import enum
 import inspect
-import json
 import pathlib
 import re
 from typing import Any, Callable, Dict, List, Optional, Type, Union
@@ -23,6 +22,13 @@ __all__ = [
     "CommonConfiguration",
 ]
 
+# NOTE: Configurations are emitted from JSON primitives so the safe dumper suffices
+# and the libyaml backed variant is far faster than the pure Python emitter when available
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper
+
 
 ORGANIZATION_REGEX = r"(([\da-zA-Z])([_\w-]{,62})\.){,127}(([\da-zA-Z])[_\w-]{,61})?([\da-zA-Z]\.((xn\-\-[a-zA-Z\d]+)|([a-zA-Z\d]{2,})))"
 NAME_REGEX = r"[a-zA-Z\_\-\.0-9]{1,64}"
@@ -212,7 +218,7 @@ class AbstractBaseConfiguration(pydantic.BaseSettings, servo.logging.Mixin):
             encoder=encoder,
             **dumps_kwargs,
         )
-        return yaml.dump(json.loads(config_json), sort_keys=False)
+        return yaml.dump(self.__config__.json_loads(config_json), Dumper=_YamlDumper, sort_keys=False)
 
     @staticmethod
     def json_encoders(
@@ -109,6 +109,8 @@ class BaseConnector(
     )
     """Shared configuration from our parent Servo instance."""
 
+    _logger: Optional[Any] = pydantic.PrivateAttr(None)
+
     @property
     def optimizer(self) -> Optional[servo.configuration.Optimizer]:
         """The optimizer for the connector."""
@@ -228,7 +230,10 @@ class BaseConnector(
         """Return a logger object bound to the connector."""
         # NOTE: We support the explicit connector ref and the context var so
         # that logging is attributable outside of an event whenever possible
-        return super().logger.bind(connector=self)
+        if self._logger is None:
+            self._logger = super().logger.bind(connector=self)
+
+        return self._logger
 
     @contextlib.contextmanager
     def current(self):
@@ -10,6 +10,7 @@ import re
 from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple, Type, Union
 
 import httpx
+import orjson
 import pydantic
 import pytz
 
@@ -18,6 +19,7 @@ import servo
 DEFAULT_BASE_URL = "http://prometheus:9090"
 API_PATH = "/api/v1"
 CHANNEL = 'metrics.prometheus'
+MAX_CONCURRENT_QUERIES = 16
 
 class AbsentMetricPolicy(str, enum.Enum):
     """An enumeration of behaviors for handling absent metrics.
@@ -126,6 +128,12 @@ class BaseRequest(pydantic.BaseModel, abc.ABC):
     """
     endpoint: str
     param_attrs: Sequence[str]
+    _params: Optional[Dict[str, str]] = pydantic.PrivateAttr(None)
+    _url: Optional[httpx.URL] = pydantic.PrivateAttr(None)
+
+    class Config:
+        # Requests are immutable so that serialized params can be memoized
+        allow_mutation = False
 
     @property
     def params(self) -> Dict[str, str]:
@@ -134,20 +142,26 @@ class BaseRequest(pydantic.BaseModel, abc.ABC):
         The values serialized as parameters is determined by the sequence
             of attribute names returned by param_attrs attribute.
         """
-        def _param_for_attr(attr: str) -> Optional[Tuple[str, str]]:
-            value = getattr(self, attr)
-            if not value:
-                return None
-            elif isinstance(value, datetime.datetime):
-                value = value.timestamp()
-            return (attr, str(value))
+        if self._params is None:
+            def _param_for_attr(attr: str) -> Optional[Tuple[str, str]]:
+                value = getattr(self, attr)
+                if not value:
+                    return None
+                elif isinstance(value, datetime.datetime):
+                    value = value.timestamp()
+                return (attr, str(value))
+
+            self._params = dict(filter(None, map(_param_for_attr, self.param_attrs)))
 
-        return dict(filter(None, map(_param_for_attr, self.param_attrs)))
+        return self._params
 
     @property
     def url(self) -> httpx.URL:
         """The relative URL for sending the request as an HTTP GET."""
-        return httpx.URL(self.endpoint, params=self.params)
+        if self._url is None:
+            self._url = httpx.URL(self.endpoint, params=self.params)
+
+        return self._url
 
 
 class TargetsStateFilter(str, enum.Enum):
@@ -468,30 +482,30 @@ class MetricResponse(BaseResponse):
         elif not self.data:
             return []
 
-        results_ = []
-        for result in self.data:
-            if self.data.is_vector:
-                results_.append(
-                    self._time_series_from_vector(result)
-                )
-            elif self.data.is_value:
-                results_.append(
-                    servo.DataPoint(self.metric, **result)
-                )
-            else:
-                raise TypeError(f"unknown Result type '{result.__class__.name}' encountered")
-
-        return results_
+        # The result type is uniform across the data so dispatch on it once
+        if self.data.is_vector:
+            return [self._time_series_from_vector(result) for result in self.data]
+        elif self.data.is_value:
+            return [servo.DataPoint(self.metric, **result) for result in self.data]
+        else:
+            raise TypeError(f"unknown Result type '{self.data.result_type}' encountered")
 
     def _time_series_from_vector(self, vector: BaseVector) -> servo.TimeSeries:
         instance = vector.metric.get("instance")
         job = vector.metric.get("job")
         annotation = " ".join(
-            map(lambda m: "=".join(m), sorted(vector.metric.items(), key=operator.itemgetter(0)))
+            "=".join(item) for item in sorted(vector.metric.items(), key=operator.itemgetter(0))
         )
-        return servo.TimeSeries(
-            self.metric,
-            list(map(lambda v: servo.DataPoint(self.metric, *v), iter(vector))),
+
+        # Vector values were validated as (datetime, float) pairs when the response
+        # was parsed so the readings are constructed without being revalidated
+        data_points = [
+            servo.DataPoint.construct(metric=self.metric, time=time, value=value)
+            for time, value in sorted(vector, key=operator.itemgetter(0))
+        ]
+        return servo.TimeSeries.construct(
+            metric=self.metric,
+            data_points=data_points,
             id=f"{{instance={instance},job={job}}}",
             annotation=annotation,
         )
@@ -510,16 +524,37 @@ class Client(pydantic.BaseModel):
 
     For details about the Prometheus HTTP API see: https://prometheus.io/docs/prometheus/latest/querying/api/
 
+    The client can be used as an async context manager to share a single pool of
+    HTTP connections across the requests sent within the block. Outside of a block
+    each request is sent through a short-lived HTTP client.
+
     ### Attributes:
         base_url: The base URL for connecting to Prometheus.
     """
     base_url: pydantic.AnyHttpUrl
     _normalize_base_url = pydantic.validator('base_url', allow_reuse=True)(_rstrip_slash)
+    _http_client: Optional[httpx.AsyncClient] = pydantic.PrivateAttr(None)
+    _url: Optional[str] = pydantic.PrivateAttr(None)
+
+    class Config:
+        # The base URL is fixed so that the API URL can be memoized
+        allow_mutation = False
 
     @property
     def url(self) -> str:
         """Return the full URL for accessing the Prometheus API."""
-        return f"{self.base_url}{API_PATH}"
+        if self._url is None:
+            self._url = f"{self.base_url}{API_PATH}"
+
+        return self._url
+
+    async def __aenter__(self) -> "Client":
+        self._http_client = httpx.AsyncClient(base_url=self.url)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        http_client, self._http_client = self._http_client, None
+        await http_client.aclose()
 
     async def query(
         self,
@@ -630,25 +665,38 @@ class Client(pydantic.BaseModel):
         servo.logger.trace(
             f"Sending request to Prometheus HTTP API (`{request}`): {method} {request.endpoint}"
         )
+        if self._http_client is not None:
+            return await self._send_request(self._http_client, method, request, response_type)
+
         async with httpx.AsyncClient(base_url=self.url) as client:
-            try:
-                kwargs = (
-                    dict(params=request.params) if method == 'GET'
-                    else dict(data=request.params)
-                )
-                http_request = client.build_request(method, request.endpoint, **kwargs)
-                http_response = await client.send(http_request)
-                http_response.raise_for_status()
-                return response_type(request=request, **http_response.json())
-            except (
-                httpx.HTTPError,
-                httpx.ReadTimeout,
-                httpx.ConnectError,
-            ) as error:
-                servo.logger.trace(
-                    f"HTTP error encountered during GET {request.url}: {error}"
-                )
-                raise
+            return await self._send_request(client, method, request, response_type)
+
+    async def _send_request(
+        self,
+        client: httpx.AsyncClient,
+        method: Literal['GET', 'POST'],
+        request: QueryRequest,
+        response_type: Type[BaseResponse],
+    ) -> BaseResponse:
+        try:
+            kwargs = (
+                dict(params=request.params) if method == 'GET'
+                else dict(data=request.params)
+            )
+            http_request = client.build_request(method, request.endpoint, **kwargs)
+            http_response = await client.send(http_request)
+            http_response.raise_for_status()
+            # NOTE: Decode the raw body directly, query results can be large
+            return response_type(request=request, **orjson.loads(http_response.content))
+        except (
+            httpx.HTTPError,
+            httpx.ReadTimeout,
+            httpx.ConnectError,
+        ) as error:
+            servo.logger.trace(
+                f"HTTP error encountered during GET {request.url}: {error}"
+            )
+            raise
 
 class PrometheusConfiguration(servo.BaseConfiguration):
     """PrometheusConfiguration objects describe how PrometheusConnector objects
@@ -775,11 +823,11 @@ class PrometheusConnector(servo.BaseConnector):
             @self.publish(CHANNEL, every=streaming_interval)
             async def _publish_metrics(publisher: servo.pubsub.Publisher) -> None:
                 report = []
-                client = Client(base_url=self.config.base_url)
-                responses = await asyncio.gather(
-                    *list(map(client.query, self.config.metrics)),
-                    return_exceptions=True
-                )
+                async with Client(base_url=self.config.base_url) as client:
+                    responses = await asyncio.gather(
+                        *list(map(client.query, self.config.metrics)),
+                        return_exceptions=True
+                    )
                 for response in responses:
                     if isinstance(response, Exception):
                         logger.error(f"failed querying Prometheus for metrics: {response}")
@@ -852,10 +900,11 @@ class PrometheusConnector(servo.BaseConnector):
             queried from Prometheus.
         """
         if metrics:
-            metrics__ = list(filter(lambda m: m.name in metrics, self.metrics()))
+            metric_names = set(metrics)
+            metrics__ = [m for m in self.metrics() if m.name in metric_names]
         else:
             metrics__ = self.metrics()
-        measuring_names = list(map(lambda m: m.name, metrics__))
+        measuring_names = [m.name for m in metrics__]
 
         # TODO: Rationalize these given the streaming metrics support
         start = datetime.datetime.now() + control.warmup
@@ -880,12 +929,15 @@ class PrometheusConnector(servo.BaseConnector):
 
         # Capture the measurements
         self.logger.info(f"Querying Prometheus for {len(metrics__)} metrics...")
-        readings = await asyncio.gather(
-            *list(map(lambda m: self._query_prometheus(m, start, end), metrics__))
-        )
-        all_readings = (
-            functools.reduce(lambda x, y: x + y, readings) if readings else []
-        )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+
+        async def _query_prometheus(metric: PrometheusMetric) -> List[servo.TimeSeries]:
+            async with semaphore:
+                return await self._query_prometheus(metric, start, end, client)
+
+        async with Client(base_url=self.config.base_url) as client:
+            readings = await asyncio.gather(*(_query_prometheus(m) for m in metrics__))
+        all_readings = list(itertools.chain.from_iterable(readings))
         measurement = servo.Measurement(readings=all_readings)
         return measurement
 
@@ -896,9 +948,13 @@ class PrometheusConnector(servo.BaseConnector):
         return response
 
     async def _query_prometheus(
-        self, metric: PrometheusMetric, start: datetime, end: datetime
+        self,
+        metric: PrometheusMetric,
+        start: datetime,
+        end: datetime,
+        client: Optional[Client] = None,
     ) -> List[servo.TimeSeries]:
-        client = Client(base_url=self.config.base_url)
+        client = client or Client(base_url=self.config.base_url)
         response = await client.query_range(metric, start, end)
         self.logger.trace(f"Got response data type {response.__class__} for metric {metric}: {response}")
         response.raise_for_error()
@@ -8,6 +8,8 @@
 # dispatch the intent into focused modules to do the real work.
 # noqa
 
+import sys
+
 import dotenv
 import uvloop
 
@@ -22,13 +24,14 @@ def run_cli() -> None:
 
     # NOTE: We load connectors here because waiting until assembly
     # is too late for registering CLI commands
-    try:
-        for connector in servo.connector.ConnectorLoader().load():
-            servo.logger.debug(f"Loaded {connector.__qualname__}")
-    except Exception:
-        servo.logger.exception(
-            "failed loading connectors via discovery", backtrace=True, diagnose=True
-        )
+    if servo.cli.connectors_required(sys.argv[1:]):
+        try:
+            for connector in servo.connector.ConnectorLoader().load():
+                servo.logger.debug(f"Loaded {connector.__qualname__}")
+        except Exception:
+            servo.logger.exception(
+                "failed loading connectors via discovery", backtrace=True, diagnose=True
+            )
 
     cli = servo.cli.ServoCLI()
     cli()
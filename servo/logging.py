@@ -11,7 +11,6 @@ import logging
 import pathlib
 import sys
 import time
-import traceback
 from typing import Any, Awaitable, Callable, Dict, Optional, Union
 
 import loguru
@@ -58,9 +57,19 @@ class Filter:
     def __init__(self, level="INFO") -> None: # noqa: D107
         self.level = level
 
+    @property
+    def level(self) -> str:
+        """The name of the minimum level of messages that pass the filter."""
+        return self._level
+
+    @level.setter
+    def level(self, level: str) -> None:
+        # Resolve the level number once rather than on every record
+        self._levelno = logger.level(level).no
+        self._level = level
+
     def __call__(self, record) -> bool: # noqa: D102
-        levelno = logger.level(self.level).no
-        return record["level"].no >= levelno
+        return record["level"].no >= self._levelno
 
 
 class ProgressHandler:
@@ -157,33 +166,53 @@ class ProgressHandler:
 
     async def _process_queue(self) -> None:
         while True:
+            # Coalesce updates that queued up while reporting so that only the
+            # latest progress of each connector operation is sent to the API
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            halting = False
             try:
-                progress = await self._queue.get()
-                if progress is None:
-                    logger.info(f"retrieved None from progress queue. halting progress reporting")
-                    break
+                latest = {}
+                for progress in batch:
+                    if progress is None:
+                        logger.info(f"retrieved None from progress queue. halting progress reporting")
+                        halting = True
+                        break
 
-                if int(progress['progress']) == 100:
-                    logger.debug(f"eliding 100% progress event: {progress}")
-                    continue
+                    latest[(progress['connector'], progress['operation'])] = progress
 
-                if asyncio.iscoroutinefunction(self._progress_reporter):
-                    await self._progress_reporter(**progress)
-                else:
-                    self._progress_reporter(**progress)
-            except servo.errors.EventCancelledError:
-                pass  # Event cancellation should not be logged as an error.
-            except asyncio.CancelledError:
-                raise
-            except Exception as error:  # pylint: disable=broad-except
-                logger.warning(f"encountered exception while processing progress logging: {repr(error)}")
-                if self._exception_handler:
-                    if asyncio.iscoroutinefunction(self._exception_handler):
-                        await self._exception_handler(error)
-                    else:
-                        self._exception_handler(error)
+                for progress in latest.values():
+                    await self._report_progress(progress)
             finally:
-                self._queue.task_done()
+                for _ in batch:
+                    self._queue.task_done()
+
+            if halting:
+                break
+
+    async def _report_progress(self, progress: Dict[str, Any]) -> None:
+        try:
+            if int(progress['progress']) == 100:
+                logger.debug(f"eliding 100% progress event: {progress}")
+                return
+
+            if asyncio.iscoroutinefunction(self._progress_reporter):
+                await self._progress_reporter(**progress)
+            else:
+                self._progress_reporter(**progress)
+        except servo.errors.EventCancelledError:
+            pass  # Event cancellation should not be logged as an error.
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            logger.warning(f"encountered exception while processing progress logging: {repr(error)}")
+            if self._exception_handler:
+                if asyncio.iscoroutinefunction(self._exception_handler):
+                    await self._exception_handler(error)
+                else:
+                    self._exception_handler(error)
 
     async def _report_error(self, message: str, record) -> None:
         """Report an error message about processing a log message annotated with a `progress` attribute."""
@@ -224,6 +253,9 @@ DEFAULT_FORMAT = (
     "{extra[traceback]}"
 )
 
+# The format handed to loguru for each record, rendered exceptions included
+_FORMAT = DEFAULT_FORMAT + "\n{exception}"
+
 
 class Formatter:
     """A logging formatter that is aware of assemblies, servos, and connectors."""
@@ -232,14 +264,18 @@ class Formatter:
         """Format a log message with contextual information about the servo assembly."""
         extra = record["extra"]
 
-        # Add optional traceback
-        if extra.get("with_traceback", False):
-            extra["traceback"] = "\n" + "".join(traceback.format_stack())
-        else:
-            extra["traceback"] = ""
+        # Add optional traceback. The record is shared across handlers so the
+        # stack is walked once per record rather than once per sink
+        if "traceback" not in extra:
+            if extra.get("with_traceback", False):
+                import traceback
+
+                extra["traceback"] = "\n" + "".join(traceback.format_stack())
+            else:
+                extra["traceback"] = ""
 
         # Respect an explicit component
-        if not "component" in record["extra"]:
+        if "component" not in extra:
             # Favor explicit connector from the extra dict or use the context var
             if connector := extra.get(
                 "connector", servo.current_connector()
@@ -260,7 +296,7 @@ class Formatter:
 
             extra["component"] = component
 
-        return DEFAULT_FORMAT + "\n{exception}"
+        return _FORMAT
 
 
 DEFAULT_FILTER = Filter("INFO")
@@ -335,7 +335,8 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
                     t for t in asyncio.all_tasks() if t is not asyncio.current_task()
                 ]
                 self.logger.info(f"Cancelling {len(tasks)} outstanding tasks")
-                [task.cancel() for task in tasks]
+                for task in tasks:
+                    task.cancel()
 
                 # Restart a fresh main loop
                 runner = self._runner_for_servo(servo.current_servo())
@@ -459,7 +460,8 @@ class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
         # The shutdown of the assembly and the servo should clean up its tasks
         tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
         if len(tasks):
-            [task.cancel() for task in tasks]
+            for task in tasks:
+                task.cancel()
 
             self.logger.info(f"Cancelling {len(tasks)} outstanding tasks")
             self.logger.debug(f"Outstanding tasks: {devtools.pformat(tasks)}")
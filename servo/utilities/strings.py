@@ -1,6 +1,7 @@
 """Miscellaneous utility functions for working with strings.
 """
 
+import functools
 from typing import Sequence
 
 
@@ -26,6 +27,7 @@ def join_to_series(
         return f"{series}{delimiter} {conjunction} {last_item}"
 
 
+@functools.lru_cache(maxsize=None)
 def commandify(module_path: str) -> str:
     """Transform an input string into a command name usable in a CLI.
     """
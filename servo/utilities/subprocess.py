@@ -3,14 +3,18 @@ execution of subprocesses with support for timeouts, streaming output, error
 management, and logging.
 """
 import asyncio
+import codecs
 import contextlib
 import datetime
+import os
 import pathlib
 import time
 from typing import IO, Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, TypeVar, Union, cast
 
 import loguru
 
+import servo.types
+
 __all__ = (
     "OutputStreamCallback",
     "SubprocessResult",
@@ -23,7 +27,35 @@ __all__ = (
 )
 
 
-_DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_FALLBACK_LIMIT = 2 ** 18  # 256 KiB
+
+
+def _limit_from_env() -> int:
+    """Return the subprocess output buffer size configured via `SERVO_SUBPROCESS_BUFFER`.
+
+    Invalid or non-positive values are ignored with a warning so that a bad
+    environment cannot break importing the servo.
+    """
+    value = os.getenv("SERVO_SUBPROCESS_BUFFER")
+    if value is None:
+        return _FALLBACK_LIMIT
+
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+
+    if limit <= 0:
+        loguru.logger.warning(
+            f"ignoring invalid SERVO_SUBPROCESS_BUFFER value {value!r}: expected a positive integer, using {_FALLBACK_LIMIT} bytes"
+        )
+        return _FALLBACK_LIMIT
+
+    return limit
+
+
+# Size of the buffer for reading subprocess output, tunable via the environment
+_DEFAULT_LIMIT = _limit_from_env()
 
 
 # Type definition for streaming output callbacks.
@@ -45,14 +77,14 @@ class SubprocessResult(NamedTuple):
     """
 
     return_code: int
-    stdout: Optional[List[str]]
-    stderr: Optional[List[str]]
+    stdout: Optional[Union[List[str], List[bytes]]]
+    stderr: Optional[Union[List[str], List[bytes]]]
 
 
 async def stream_subprocess_exec(
     program: str,
     *args,
-    cwd: Union[pathlib.Path, Callable[[], pathlib.Path]] = pathlib.Path.cwd,
+    cwd: Union[pathlib.Path, Callable[[], pathlib.Path], None] = None,
     env: Optional[Dict[str, str]] = None,
     timeout: Timeout = None,
     stdout_callback: Optional[OutputStreamCallback] = None,
@@ -61,6 +93,7 @@ async def stream_subprocess_exec(
     stdout: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     stderr: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     limit: int = _DEFAULT_LIMIT,
+    binary: bool = False,
     **kwargs,
 ) -> int:
     """
@@ -68,7 +101,7 @@ async def stream_subprocess_exec(
 
     :param program: The program to run.
     :param *args: A list of string arguments to supply to the executed program.
-    :param cwd: The working directory to execute the subprocess in.
+    :param cwd: The working directory to execute the subprocess in. Defaults to the working directory of the servo.
     :param env: An optional dictionary of environment variables to apply to the subprocess.
     :param timeout: An optional timeout in seconds for how long to read the streams before giving up.
     :param stdout_callback: An optional callable invoked with each line read from stdout. Must accept a single string positional argument and returns nothing.
@@ -77,10 +110,14 @@ async def stream_subprocess_exec(
     :param stdout: A file descriptor, IO stream, or None value to use as the standard output of the subprocess.
     :param stderr: A file descriptor, IO stream, or None value to use as the standard error of the subprocess.
     :param limit: The amount of memory to allocate for buffering subprocess data.
+    :param binary: When True, output lines are delivered as undecoded bytes rather than strings.
 
     :raises asyncio.TimeoutError: Raised if the timeout expires before the subprocess exits.
     :return: The exit status of the subprocess.
     """
+    # Output without a callback to consume it is discarded by the OS rather than read
+    stdout = _devnull_if_unread(stdout, stdout_callback)
+    stderr = _devnull_if_unread(stderr, stderr_callback)
     process = await asyncio.create_subprocess_exec(
         program,
         *args,
@@ -97,19 +134,21 @@ async def stream_subprocess_exec(
         timeout=timeout,
         stdout_callback=stdout_callback,
         stderr_callback=stderr_callback,
+        binary=binary,
     )
 
 
 async def run_subprocess_exec(
     program: str,
     *args,
-    cwd: pathlib.Path = pathlib.Path.cwd(),
+    cwd: Optional[pathlib.Path] = None,
     env: Optional[Dict[str, str]] = None,
     timeout: Timeout = None,
     stdin: Union[int, IO[Any], None] = None,
     stdout: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     stderr: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     limit: int = _DEFAULT_LIMIT,
+    binary: bool = False,
     **kwargs,
 ) -> SubprocessResult:
     """
@@ -122,13 +161,14 @@ async def run_subprocess_exec(
 
     :param program: The program to run.
     :param *args: A list of string arguments to supply to the executed program.
-    :param cwd: The working directory to execute the subprocess in.
+    :param cwd: The working directory to execute the subprocess in. Defaults to the working directory of the servo.
     :param env: An optional dictionary of environment variables to apply to the subprocess.
     :param timeout: An optional timeout in seconds for how long to read the streams before giving up.
     :param stdin: A file descriptor, IO stream, or None value to use as the standard input of the subprocess. Default is `None`.
     :param stdout: A file descriptor, IO stream, or None value to use as the standard output of the subprocess.
     :param stderr: A file descriptor, IO stream, or None value to use as the standard error of the subprocess.
     :param limit: The amount of memory to allocate for buffering subprocess data.
+    :param binary: When True, output lines are delivered as undecoded bytes rather than strings.
 
     :raises asyncio.TimeoutError: Raised if the timeout expires before the subprocess exits.
     :return: A named tuple value of the exit status and two string lists of standard output and standard error.
@@ -146,8 +186,9 @@ async def run_subprocess_exec(
             stdout=stdout,
             stderr=stderr,
             limit=limit,
-            stdout_callback=lambda m: stdout_list.append(m),
-            stderr_callback=lambda m: stderr_list.append(m),
+            binary=binary,
+            stdout_callback=stdout_list.append,
+            stderr_callback=stderr_list.append,
             **kwargs,
         ),
         stdout_list,
@@ -158,13 +199,14 @@ async def run_subprocess_exec(
 async def run_subprocess_shell(
     cmd: str,
     *,
-    cwd: pathlib.Path = pathlib.Path.cwd(),
+    cwd: Optional[pathlib.Path] = None,
     env: Optional[Dict[str, str]] = None,
     timeout: Timeout = None,
     stdin: Union[int, IO[Any], None] = None,
     stdout: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     stderr: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     limit: int = _DEFAULT_LIMIT,
+    binary: bool = False,
     **kwargs,
 ) -> SubprocessResult:
     """
@@ -176,13 +218,14 @@ async def run_subprocess_shell(
     standard error onto the standard output stream.
 
     :param cmd: The command to run.
-    :param cwd: The working directory to execute the subprocess in.
+    :param cwd: The working directory to execute the subprocess in. Defaults to the working directory of the servo.
     :param env: An optional dictionary of environment variables to apply to the subprocess.
     :param timeout: An optional timeout in seconds for how long to read the streams before giving up.
     :param stdin: A file descriptor, IO stream, or None value to use as the standard input of the subprocess. Default is `None`.
     :param stdout: A file descriptor, IO stream, or None value to use as the standard output of the subprocess.
     :param stderr: A file descriptor, IO stream, or None value to use as the standard error of the subprocess.
     :param limit: The amount of memory to allocate for buffering subprocess data.
+    :param binary: When True, output lines are delivered as undecoded bytes rather than strings.
 
     :raises asyncio.TimeoutError: Raised if the timeout expires before the subprocess exits.
     :return: A named tuple value of the exit status and two string lists of standard output and standard error.
@@ -199,8 +242,9 @@ async def run_subprocess_shell(
             stdout=stdout,
             stderr=stderr,
             limit=limit,
-            stdout_callback=lambda m: stdout_list.append(m),
-            stderr_callback=lambda m: stderr_list.append(m),
+            binary=binary,
+            stdout_callback=stdout_list.append,
+            stderr_callback=stderr_list.append,
             **kwargs,
         ),
         stdout_list,
@@ -211,7 +255,7 @@ async def run_subprocess_shell(
 async def stream_subprocess_shell(
     cmd: str,
     *,
-    cwd: Union[pathlib.Path, Callable[[], pathlib.Path]] = pathlib.Path.cwd,
+    cwd: Union[pathlib.Path, Callable[[], pathlib.Path], None] = None,
     env: Optional[Dict[str, str]] = None,
     timeout: Timeout = None,
     stdout_callback: Optional[OutputStreamCallback] = None,
@@ -220,13 +264,14 @@ async def stream_subprocess_shell(
     stdout: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     stderr: Union[int, IO[Any], None] = asyncio.subprocess.PIPE,
     limit: int = _DEFAULT_LIMIT,
+    binary: bool = False,
     **kwargs,
 ) -> int:
     """
     Run a shell command asynchronously in a subprocess and stream its output.
 
     :param cmd: The command to run.
-    :param cwd: The working directory to execute the subprocess in.
+    :param cwd: The working directory to execute the subprocess in. Defaults to the working directory of the servo.
     :param env: An optional dictionary of environment variables to apply to the subprocess.
     :param timeout: An optional timeout in seconds for how long to read the streams before giving up.
     :param stdout_callback: An optional callable invoked with each line read from stdout. Must accept a single string positional argument and returns nothing.
@@ -235,10 +280,14 @@ async def stream_subprocess_shell(
     :param stdout: A file descriptor, IO stream, or None value to use as the standard output of the subprocess.
     :param stderr: A file descriptor, IO stream, or None value to use as the standard error of the subprocess.
     :param limit: The amount of memory to allocate for buffering subprocess data.
+    :param binary: When True, output lines are delivered as undecoded bytes rather than strings.
 
     :raises asyncio.TimeoutError: Raised if the timeout expires before the subprocess exits.
     :return: The exit status of the subprocess.
     """
+    # Output without a callback to consume it is discarded by the OS rather than read
+    stdout = _devnull_if_unread(stdout, stdout_callback)
+    stderr = _devnull_if_unread(stderr, stderr_callback)
     process = await asyncio.create_subprocess_shell(
         cmd,
         cwd=(cwd() if callable(cwd) else cwd),
@@ -249,19 +298,18 @@ async def stream_subprocess_shell(
         limit=limit,
         **kwargs,
     )
-    from servo.types import Duration
-
-    start = time.time()
-    timeout_note = f" ({Duration(timeout)} timeout)" if timeout else ""
+    start = time.perf_counter()
+    timeout_note = f" ({servo.types.Duration(timeout)} timeout)" if timeout else ""
     loguru.logger.info(f"Running subprocess command `{cmd}`{timeout_note}")
     result = await stream_subprocess_output(
         process,
         timeout=timeout,
         stdout_callback=stdout_callback,
         stderr_callback=stderr_callback,
+        binary=binary,
     )
-    end = time.time()
-    duration = Duration(end - start)
+    end = time.perf_counter()
+    duration = servo.types.Duration(end - start)
     if result == 0:
         loguru.logger.success(
             f"Subprocess succeeded in {duration} (`{cmd}`)"
@@ -278,6 +326,7 @@ async def stream_subprocess_output(
     timeout: Timeout = None,
     stdout_callback: Optional[OutputStreamCallback] = None,
     stderr_callback: Optional[OutputStreamCallback] = None,
+    binary: bool = False,
 ) -> int:
     """
     Asynchronously read the stdout and stderr output streams of a subprocess and
@@ -287,6 +336,7 @@ async def stream_subprocess_output(
     :param timeout: An optional timeout in seconds for how long to read the streams before giving up.
     :param stdout_callback: An optional callable invoked with each line read from stdout. Must accept a single string positional argument and returns nothing.
     :param stderr_callback: An optional callable invoked with each line read from stderr. Must accept a single string positional argument and returns nothing.
+    :param binary: When True, output lines are delivered as undecoded bytes rather than strings.
 
     :raises asyncio.TimeoutError: Raised if the timeout expires before the subprocess exits.
     :return: The exit status of the subprocess.
@@ -295,25 +345,26 @@ async def stream_subprocess_output(
     if process.stdout:
         tasks.append(
             asyncio.create_task(
-                _read_lines_from_output_stream(process.stdout, stdout_callback), name="stdout"
+                _read_lines_from_output_stream(process.stdout, stdout_callback, binary=binary),
+                name="stdout",
             )
         )
     if process.stderr:
         tasks.append(
             asyncio.create_task(
-                _read_lines_from_output_stream(process.stderr, stderr_callback), name="stderr"
+                _read_lines_from_output_stream(process.stderr, stderr_callback, binary=binary),
+                name="stderr",
             )
         )
 
+    wait_task = asyncio.create_task(process.wait(), name="wait")
+
     timeout_in_seconds = (
         timeout.total_seconds() if isinstance(timeout, datetime.timedelta) else timeout
     )
     try:
         # Gather the stream output tasks and the parent process
-        gather_task = asyncio.gather(
-            *tasks,
-            process.wait()
-        )
+        gather_task = asyncio.gather(*tasks, wait_task)
         await asyncio.wait_for(gather_task, timeout=timeout_in_seconds)
 
     except asyncio.TimeoutError:
@@ -324,7 +375,9 @@ async def stream_subprocess_output(
         with contextlib.suppress(asyncio.CancelledError):
             await gather_task
 
-        [task.cancel() for task in tasks]
+        for task in tasks:
+            task.cancel()
+
         await asyncio.gather(*tasks, return_exceptions=True)
 
         raise
@@ -332,28 +385,77 @@ async def stream_subprocess_output(
     return cast(int, process.returncode)
 
 
+def _devnull_if_unread(
+    stream: Union[int, IO[Any], None], callback: Optional[OutputStreamCallback]
+) -> Union[int, IO[Any], None]:
+    """
+    Return `DEVNULL` in place of a piped output stream that has no callback to read it.
+    """
+    if stream == asyncio.subprocess.PIPE and callback is None:
+        return asyncio.subprocess.DEVNULL
+
+    return stream
+
+
 async def _read_lines_from_output_stream(
     stream: asyncio.streams.StreamReader,
     callback: Optional[OutputStreamCallback],
     *,
     encoding: str = "utf-8",
+    binary: bool = False,
 ) -> None:
     """
     Asynchronously read a subprocess output stream line by line,
     optionally invoking a callback with each line as it is read.
 
+    Output is read and decoded in chunks of up to the buffer limit of the stream and split
+    into lines in process so that verbose subprocesses do not resume the reader once per line.
+    An incremental decoder carries multibyte characters split across chunk boundaries.
+
     :param stream: An IO stream reader linked to the stdout or stderr of a subprocess.
     :param callback: An optionally async callable that accepts a single string positional argument and returns nothing.
     :param encoding: The encoding to use when decoding from bytes to string (default is utf-8).
+    :param binary: When True, lines are passed to the callback as bytes without being decoded.
+
+    :raises ValueError: Raised if a line of output exceeds the buffer limit of the stream.
     """
+    limit = getattr(stream, "_limit", _DEFAULT_LIMIT)
+    is_coroutine_callback = asyncio.iscoroutinefunction(callback)
+    decoder = None if binary else codecs.getincrementaldecoder(encoding)()
+    empty, newline = (b"", b"\n") if binary else ("", "\n")
+
+    # Fragments of a line awaiting its newline are only joined once the line is complete
+    pending: List[Union[str, bytes]] = []
+    pending_size = 0
     while True:
-        line = await stream.readline()
-        if line:
-            line = line.decode(encoding).rstrip()
+        chunk = await stream.read(limit)
+        if chunk:
+            *lines, tail = (decoder.decode(chunk) if decoder else chunk).split(newline)
+            if lines and pending:
+                pending.append(lines[0])
+                lines[0] = empty.join(pending)
+                pending.clear()
+                pending_size = 0
+
+            if tail:
+                pending.append(tail)
+                pending_size += len(tail)
+                if pending_size > limit:
+                    raise ValueError(f"line of subprocess output exceeds the limit of {limit}")
+        else:
+            # Flush the decoder and the trailing line if the output did not end with a newline
+            if decoder:
+                pending.append(decoder.decode(b"", final=True))
+            line = empty.join(pending)
+            lines = [line] if line else []
+
+        for line in lines:
+            line = line.rstrip()
             if callback:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coroutine_callback:
                     await callback(line)
                 else:
                     callback(line)
-        else:
+
+        if not chunk:
             break
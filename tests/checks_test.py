@@ -1,3 +1,4 @@
+import asyncio
 import re
 from datetime import datetime
 from inspect import Signature
@@ -488,6 +489,23 @@ async def test_filtering(name, id, tags, expected_ids) -> None:
     assert ids == expected_ids
 
 
+def test_filter_matches_after_construct_copy_and_assignment() -> None:
+    one = Check(name="one", success=True)
+    two = Check(name="two", success=True)
+
+    constructed = CheckFilter.construct(name="one")
+    assert constructed.matches(one)
+    assert not constructed.matches(two)
+
+    copied = constructed.copy(update={"name": "two"})
+    assert copied.matches(two)
+    assert not copied.matches(one)
+
+    copied.name = "one"
+    assert copied.matches(one)
+    assert not copied.matches(two)
+
+
 class RequirementChecks(BaseChecks):
     @check("required-1", severity=ErrorSeverity.critical)
     def check_one(self) -> None:
@@ -627,6 +645,46 @@ async def test_mixed_checks(name, expected_results) -> None:
     assert actual_results == expected_results
 
 
+async def test_runs_concurrently_without_halting() -> None:
+    started = []
+
+    class ConcurrentChecks(BaseChecks):
+        @check("one")
+        async def check_one(self) -> None:
+            started.append("one")
+            await asyncio.sleep(0)
+            assert "two" in started, "check two was not started concurrently"
+
+        @check("two")
+        async def check_two(self) -> None:
+            started.append("two")
+
+    checks = await ConcurrentChecks.run(BaseConfiguration(), halt_on=None)
+    attrs = list(map(lambda c: [c.name, c.success], checks))
+    assert attrs == [["one", True], ["two", True]]
+
+
+async def test_concurrent_checks_are_cancelled_on_error() -> None:
+    cancelled = []
+
+    class FailingChecks(BaseChecks):
+        async def check_one(self) -> Check:
+            raise RuntimeError("failed")
+
+        async def check_two(self) -> Check:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("two")
+                raise
+
+            return Check(name="two", success=True)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        await FailingChecks.run(BaseConfiguration(), halt_on=None)
+    assert cancelled == ["two"]
+
+
 async def test_generate_checks() -> None:
     handler = lambda c: f"so_check_it_{c}"
     items = ["one", "two", "three"]
@@ -638,6 +696,48 @@ async def test_generate_checks() -> None:
     assert messages == ["so_check_it_one", "so_check_it_two", "so_check_it_three"]
 
 
+async def test_generate_batched_checks() -> None:
+    batches = []
+
+    async def handler(chunk: List[str]) -> List[str]:
+        batches.append(chunk)
+        return list(map(lambda c: f"so_check_it_{c}", chunk))
+
+    items = ["one", "two", "three"]
+    ItemChecks = create_checks_from_iterable(handler, items, batch_size=2)
+    checker = ItemChecks(BaseConfiguration())
+    results = await checker.run_all()
+    assert batches == [["one", "two"], ["three"]]
+    messages = list(map(lambda c: c.message, results))
+    assert messages == ["so_check_it_one", "so_check_it_two", "so_check_it_three"]
+
+    await checker.run_all()
+    assert len(batches) == 4
+
+
+async def test_batched_checks_run_handler_per_invocation() -> None:
+    batches = []
+
+    def handler(chunk: List[str]) -> List[str]:
+        batches.append(chunk)
+        return list(map(lambda c: f"so_check_it_{c}", chunk))
+
+    ItemChecks = create_checks_from_iterable(handler, ["one", "two"], batch_size=2)
+    checker = ItemChecks(BaseConfiguration())
+    check_id = (await checker.run_all())[0].id
+    batches.clear()
+
+    for _ in range(2):
+        result = await checker.run_one(id=check_id)
+        assert result.message == "so_check_it_one"
+    assert batches == [["one", "two"], ["one", "two"]]
+
+    method = getattr(checker, f"check_{check_id}")
+    await method()
+    await method()
+    assert len(batches) == 4
+
+
 async def test_add_checks_to_existing_class() -> None:
     handler = lambda c: f"so_check_it_{c}"
     items = ["five", "six", "seven"]
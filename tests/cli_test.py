@@ -2,6 +2,7 @@ import json
 import os
 import re
 from pathlib import Path
+from typing import List
 
 import pytest
 import respx
@@ -401,6 +402,22 @@ def test_version_no_optimizer(cli_runner: CliRunner, servo_cli: Typer) -> None:
     assert f"Servo v{servo.__version__}" in result.stdout
 
 
+@pytest.mark.parametrize(
+    "args, required",
+    [
+        ([], True),
+        (["--help"], True),
+        (["check"], True),
+        (["version"], False),
+        (["version", "--short", "-f", "json"], False),
+        (["version", "--help"], True),
+        (["version", "vegeta"], True),
+    ],
+)
+def test_connectors_required(args: List[str], required: bool) -> None:
+    assert servo.cli.connectors_required(args) == required
+
+
 def test_config(
     cli_runner: CliRunner,
     servo_cli: Typer,
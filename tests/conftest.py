@@ -1,5 +1,6 @@
 import asyncio
 import builtins
+import copy
 import enum
 import contextlib
 import json
@@ -8,7 +9,7 @@ import pathlib
 import random
 import socket
 import string
-from typing import AsyncGenerator, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import backoff
 import chevron
@@ -23,10 +24,15 @@ import yaml
 
 import servo.cli
 import servo.connectors.kubernetes
+import servo.runner
 import tests.helpers
 
-# Add the devtools debug() function globally in tests
-builtins.debug = devtools.debug
+# Add the devtools debug() function globally in tests. Pretty printing is
+# only done when SERVO_TEST_DEBUG is set to keep it out of regular runs
+def _discard_debug(*args, **kwargs) -> None:
+    pass
+
+builtins.debug = devtools.debug if os.getenv("SERVO_TEST_DEBUG") else _discard_debug
 
 # Render all manifests as Mustache templates by default
 kubetest.manifest.__render__ = chevron.render
@@ -507,15 +513,37 @@ async def fakeapi_client(fakeapi_url: str) -> AsyncIterator[httpx.AsyncClient]:
 
 ######
 
-@pytest.fixture()
-async def assembly(servo_yaml: pathlib.Path) -> servo.assembly.Assembly:
+@pytest.fixture(scope="session")
+def assembly_config_yaml() -> str:
+    """Return the generated configuration of the assembly fixture as YAML.
+
+    Building the config model and generating the config is deterministic so
+    it is done once per session rather than for every assembly.
+    """
     config_model = servo.assembly._create_config_model_from_routes(
         {
             "adjust": tests.helpers.AdjustConnector,
         }
     )
-    config = config_model.generate()
-    servo_yaml.write_text(config.yaml())
+    return config_model.generate().yaml()
+
+
+@pytest.fixture(scope="module")
+def assembly_config(assembly_config_yaml: str) -> Dict[str, Any]:
+    """Return the assembly configuration parsed from `assembly_config_yaml`.
+
+    The YAML is parsed once per module (so module overrides of
+    `assembly_config_yaml` are honored) and handed to `Assembly.assemble`
+    directly so each assembly does not have to re-read the config file.
+    """
+    return yaml.load(assembly_config_yaml, Loader=yaml.FullLoader)
+
+
+@pytest.fixture()
+async def assembly(
+    servo_yaml: pathlib.Path, assembly_config_yaml: str, assembly_config: Dict[str, Any]
+) -> servo.assembly.Assembly:
+    servo_yaml.write_text(assembly_config_yaml)
 
     optimizer = servo.Optimizer(
         id="servox.opsani.com/tests",
@@ -523,7 +551,7 @@ async def assembly(servo_yaml: pathlib.Path) -> servo.assembly.Assembly:
 
     )
     assembly_ = await servo.assembly.Assembly.assemble(
-        config_file=servo_yaml, optimizer=optimizer
+        config_file=servo_yaml, configs=[copy.deepcopy(assembly_config)], optimizer=optimizer
     )
     return assembly_
 
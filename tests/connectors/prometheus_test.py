@@ -4,7 +4,6 @@ import pathlib
 import re
 from typing import AsyncIterator
 
-import freezegun
 import httpx
 import pydantic
 import pytest
@@ -24,6 +23,8 @@ from servo.connectors.prometheus import (
 )
 from servo.types import *
 
+QUERY_RANGE_PATTERN = re.compile(r"/api/v1/query_range.+")
+
 
 class TestPrometheusMetric:
     def test_accepts_step_as_duration(self):
@@ -58,14 +59,6 @@ class TestPrometheusMetric:
                 "type": "type_error.none.not_allowed",
             } in error.errors()
 
-    # NOTE: Floating point values may come back as strings?
-    def test_conversion_of_floats_from_strings(self):
-        pass
-
-    # item[1] == 'NaN':
-    def test_handling_nan_values(self):
-        pass
-
 
 class TestPrometheusConfiguration:
     def test_url_required(self):
@@ -78,15 +71,20 @@ class TestPrometheusConfiguration:
                 "type": "type_error.none.not_allowed",
             } in error.errors()
 
-    def test_supports_localhost_url(self):
-        config = PrometheusConfiguration(base_url="http://localhost:9090", metrics=[])
-        assert config.base_url == "http://localhost:9090"
-
-    def test_supports_cluster_url(self):
-        config = PrometheusConfiguration(
-            base_url="http://prometheus.default.svc.cluster.local:9090", metrics=[]
-        )
-        assert config.base_url == "http://prometheus.default.svc.cluster.local:9090"
+    @pytest.mark.parametrize(
+        "base_url, expected",
+        [
+            ("http://localhost:9090", "http://localhost:9090"),
+            (
+                "http://prometheus.default.svc.cluster.local:9090",
+                "http://prometheus.default.svc.cluster.local:9090",
+            ),
+            ("http://prometheus.io/some/path/", "http://prometheus.io/some/path"),
+        ],
+    )
+    def test_supports_url(self, base_url, expected):
+        config = PrometheusConfiguration(base_url=base_url, metrics=[])
+        assert config.base_url == expected
 
     def test_rejects_invalid_url(self):
         try:
@@ -160,11 +158,14 @@ class TestPrometheusConfiguration:
 
 
 class TestPrometheusRequest:
-    @freezegun.freeze_time("2020-01-01")
-    def test_url(self):
+    @pytest.fixture
+    def start(self) -> datetime.datetime:
+        return datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def test_url(self, start):
         query = RangeQuery(
-            start=datetime.datetime.now(),
-            end=datetime.datetime.now() + Duration("36h"),
+            start=start,
+            end=start + Duration("36h"),
             query="go_memstats_heap_inuse_bytes",
             step="1m"
         )
@@ -174,11 +175,10 @@ class TestPrometheusRequest:
             == "/query_range?query=go_memstats_heap_inuse_bytes&start=1577836800.0&end=1577966400.0&step=1m"
         )
 
-    @freezegun.freeze_time("2020-01-01")
-    def test_other_url(self):
+    def test_other_url(self, start):
         request = RangeQuery(
-            start=datetime.datetime.now(),
-            end=datetime.datetime.now() + Duration("36h"),
+            start=start,
+            end=start + Duration("36h"),
             query="go_memstats_heap_inuse_bytes",
             step='1m'
         )
@@ -266,7 +266,7 @@ class TestPrometheusChecks:
             ).mock(return_value=httpx.Response(200, json=targets_response))
 
             respx_mock.get(
-                re.compile(r"/api/v1/query_range.+"),
+                QUERY_RANGE_PATTERN,
                 name="query",
             ).mock(return_value=httpx.Response(200, json=query_matrix_response))
             yield respx_mock
@@ -289,7 +289,6 @@ class TestPrometheusChecks:
         assert check.message is None
         assert request.called
 
-    @respx.mock
     async def test_check_base_url_failing(self, checks) -> None:
         with respx.mock(base_url="http://localhost:9090") as respx_mock:
             request = respx_mock.get("/api/v1/targets").mock(return_value=httpx.Response(status_code=503))
@@ -303,7 +302,6 @@ class TestPrometheusChecks:
             assert check.message is not None
             assert isinstance(check.exception, httpx.HTTPStatusError)
 
-    @respx.mock
     async def test_check_queries(self, mocked_api, checks) -> None:
         request = mocked_api["query"]
         multichecks = await checks._expand_multichecks()
@@ -327,7 +325,6 @@ class TestPrometheusChecks:
             (targets_response_(), True, "found 1 targets"),
         ],
     )
-    @respx.mock
     async def test_check_targets(self, checks, targets, success, message) -> str:
         with respx.mock(base_url="http://localhost:9090") as respx_mock:
             request = respx_mock.get("/api/v1/targets").mock(httpx.Response(200, json=targets))
@@ -385,10 +382,6 @@ class TestPrometheusIntegration:
             )
             debug(targets)
 
-    async def test_target_discovery(self) -> None:
-        # Deploy fiber-http with annotations and Prometheus will start scraping it
-        ...
-
     async def test_range_query_empty_returns_zero_vector_in_matrix(
         self,
         kube,
@@ -579,10 +572,6 @@ def empty_targets_response() -> Dict[str, Any]:
 
 class TestCLI:
     class TestTargets:
-        async def test_no_active_connectors(self) -> None:
-            # TODO: Put config into tmpdir without connector
-            ...
-
         @pytest.fixture
         def metric(self) -> PrometheusMetric:
             return PrometheusMetric(
@@ -602,7 +591,6 @@ class TestCLI:
         def connector(self, config: PrometheusConfiguration) -> PrometheusConnector:
             return PrometheusConnector(config=config)
 
-        @respx.mock
         def test_one_active_connector(self, targets_response, optimizer_env: None, connector: PrometheusConnector, config: PrometheusConfiguration, servo_cli: servo.cli.ServoCLI, cli_runner: typer.testing.CliRunner, tmp_path: pathlib.Path) -> None:
             with respx.mock(base_url="http://localhost:9090") as respx_mock:
                 request = respx_mock.get("/api/v1/targets").mock(httpx.Response(200, json=targets_response))
@@ -617,17 +605,6 @@ class TestCLI:
                 assert "opsani-envoy-sidecars  up        http://192.168.95.123:9901/stats/prometheus" in result.stdout
 
 
-        async def test_multiple_active_connector(self) -> None:
-            # TODO: Put config into tmpdir with two connectors, invoke both, invoke each one
-            ...
-
-# CLI TESTS:
-# Test without active target
-# Test with multiple targets
-# Tests with specific target
-# TODO: Add query CLI
-
-
 class TestConnector:
     @pytest.fixture
     def metric(self) -> PrometheusMetric:
@@ -660,7 +637,7 @@ class TestConnector:
     @respx.mock
     async def test_measure(self, connector) -> None:
         respx.mock.get(
-            re.compile(r"/api/v1/query_range.+"),
+            QUERY_RANGE_PATTERN,
             name="query",
         ).mock(return_value=httpx.Response(200, json={
             "status": "success",
@@ -693,7 +670,6 @@ class TestConnector:
         assert len(results) > 0
         assert results[0].id == 'check_base_url'
 
-    @respx.mock
     async def test_one_active_connector(self, connector: PrometheusConnector, targets_response) -> None:
         with respx.mock(base_url="http://localhost:9090") as respx_mock:
             request = respx_mock.get("/api/v1/targets").mock(return_value=httpx.Response(200, json=targets_response))
@@ -1287,6 +1263,28 @@ class TestClient:
             client.url == "http://prometheus.default.svc.cluster.local:9090/api/v1"
         )
 
+    async def test_shares_http_client_within_context(self):
+        client = Client(base_url="http://localhost:9090/")
+        async with client:
+            http_client = client._http_client
+            assert http_client is not None
+            assert str(http_client.base_url) == "http://localhost:9090/api/v1/"
+
+        assert client._http_client is None
+        assert http_client.is_closed
+
+    async def test_sends_requests_through_shared_http_client(self, mocker, targets_response) -> None:
+        async_client = mocker.patch.object(httpx, "AsyncClient", wraps=httpx.AsyncClient)
+        client = Client(base_url="http://localhost:9090")
+        with respx.mock(base_url="http://localhost:9090") as respx_mock:
+            request = respx_mock.get("/api/v1/targets").mock(httpx.Response(200, json=targets_response))
+            async with client:
+                await client.list_targets()
+                await client.list_targets()
+
+        assert request.call_count == 2
+        assert async_client.call_count == 1
+
 class TestInstantQuery:
     @pytest.fixture
     def query(self) -> servo.connectors.prometheus.InstantQuery:
@@ -1309,7 +1307,6 @@ class TestTargetsRequest:
         assert request.param_attrs == ('state', )
         assert request.params == {}
 
-@respx.mock
 async def test_list_targets() -> None:
     client = Client(base_url="http://localhost:9090/")
     with respx.mock(base_url=client.base_url) as respx_mock:
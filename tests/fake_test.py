@@ -1,7 +1,8 @@
+import copy
 import datetime
 import pathlib
 import random
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import fastapi
 import pytest
@@ -172,21 +173,17 @@ async def test_state_machine_lifecyle(measurement: servo.Measurement) -> None:
     await static_optimizer.say_goodbye()
 
 @pytest.fixture()
-async def assembly(servo_yaml: pathlib.Path) -> servo.assembly.Assembly:
-    config_model = servo.assembly._create_config_model_from_routes(
-        {
-            "adjust": tests.helpers.AdjustConnector,
-        }
-    )
-    config = config_model.generate()
-    servo_yaml.write_text(config.yaml())
+async def assembly(
+    servo_yaml: pathlib.Path, assembly_config_yaml: str, assembly_config: Dict[str, Any]
+) -> servo.assembly.Assembly:
+    servo_yaml.write_text(assembly_config_yaml)
 
     optimizer = servo.Optimizer(
         id="servox.opsani.com/tests",
         token="00000000-0000-0000-0000-000000000000",
     )
     assembly_ = await servo.assembly.Assembly.assemble(
-        config_file=servo_yaml, optimizer=optimizer
+        config_file=servo_yaml, configs=[copy.deepcopy(assembly_config)], optimizer=optimizer
     )
     return assembly_
 
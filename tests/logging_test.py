@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 
 import asynctest
@@ -206,6 +207,22 @@ class TestProgressHandler:
         progress_reporter.assert_called()
         error_reporter.assert_not_called()
 
+    async def test_coalesces_queued_progress(self, handler, progress_reporter):
+        started_at = datetime.now()
+        for progress in (25, 50, 75):
+            handler._queue.put_nowait(
+                dict(operation="hacking", progress=progress, connector="foo", started_at=started_at)
+            )
+        handler._queue.put_nowait(
+            dict(operation="cracking", progress=10, connector="foo", started_at=started_at)
+        )
+
+        handler._queue_processor = asyncio.create_task(handler._process_queue())
+        await handler._queue.join()
+
+        assert progress_reporter.call_count == 2
+        assert [call.kwargs["progress"] for call in progress_reporter.call_args_list] == [75, 10]
+
     # NOTE: Inference tests dependent on context vars (operation and started_at)
     async def test_success_inference_from_context_var(
         self, logger, progress_reporter, error_reporter
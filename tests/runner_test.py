@@ -1,26 +1,34 @@
 
 import asyncio
+import copy
 import pathlib
+from typing import Any, Dict
 
 import pytest
 
 import servo
 import servo.connectors.prometheus
+import servo.runner
 import tests.fake
 import tests.helpers
 
 pytestmark = [pytest.mark.asyncio, pytest.mark.integration]
 
-@pytest.fixture()
-async def assembly(servo_yaml: pathlib.Path) -> servo.assembly.Assembly:
+@pytest.fixture(scope="session")
+def assembly_config_yaml() -> str:
     config_model = servo.assembly._create_config_model_from_routes(
         {
             "prometheus": servo.connectors.prometheus.PrometheusConnector,
             "adjust": tests.helpers.AdjustConnector,
         }
     )
-    config = config_model.generate()
-    servo_yaml.write_text(config.yaml())
+    return config_model.generate().yaml()
+
+@pytest.fixture()
+async def assembly(
+    servo_yaml: pathlib.Path, assembly_config_yaml: str, assembly_config: Dict[str, Any]
+) -> servo.assembly.Assembly:
+    servo_yaml.write_text(assembly_config_yaml)
 
     # TODO: This needs a real optimizer ID
     optimizer = servo.configuration.Optimizer(
@@ -28,7 +36,7 @@ async def assembly(servo_yaml: pathlib.Path) -> servo.assembly.Assembly:
         token="179eddc9-20e2-4096-b064-824b72a83b7d",
     )
     assembly_ = await servo.assembly.Assembly.assemble(
-        config_file=servo_yaml, optimizer=optimizer
+        config_file=servo_yaml, configs=[copy.deepcopy(assembly_config)], optimizer=optimizer
     )
     return assembly_
 
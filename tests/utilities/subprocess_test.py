@@ -34,6 +34,26 @@ async def test_run_subprocess_shell():
     assert stderr == []
 
 
+async def test_run_subprocess_shell_binary():
+    status_code, stdout, stderr = await servo.utilities.subprocess.run_subprocess_shell(
+        "printf 'test\\nbinary'", binary=True
+    )
+    assert status_code == 0
+    assert stdout == [b"test", b"binary"]
+    assert stderr == []
+
+
+async def test_run_subprocess_shell_respects_limit():
+    status_code, stdout, stderr = await servo.utilities.subprocess.run_subprocess_shell(
+        "printf 'abc\\ndef\\n\\nghi'", limit=4
+    )
+    assert status_code == 0
+    assert stdout == ["abc", "def", "", "ghi"]
+
+    with pytest.raises(ValueError, match="exceeds the limit of 4"):
+        await servo.utilities.subprocess.run_subprocess_shell("printf 'abcdefgh'", limit=4)
+
+
 async def test_named_tuple_output():
     result = await servo.utilities.subprocess.run_subprocess_shell("echo test")
     assert result.return_code == 0
@@ -53,3 +73,21 @@ async def test_run_subprocess_timeout():
         "echo 'test'", stdout_callback=lambda m: output.append(m), timeout=10.0
     )
     assert output == ["test"]
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, 2 ** 18),
+        ("65536", 65536),
+        ("", 2 ** 18),
+        ("lots", 2 ** 18),
+        ("0", 2 ** 18),
+        ("-1", 2 ** 18),
+    ]
+)
+def test_limit_from_env(monkeypatch, value, expected) -> None:
+    if value is None:
+        monkeypatch.delenv("SERVO_SUBPROCESS_BUFFER", raising=False)
+    else:
+        monkeypatch.setenv("SERVO_SUBPROCESS_BUFFER", value)
+    assert servo.utilities.subprocess._limit_from_env() == expected